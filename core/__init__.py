@@ -12,6 +12,7 @@ from .nlp_processor import NLPProcessor, NLPResult, NLPIntent  # type: ignore
 from .command_parser import CommandParser, ParsedCommand, ParsedParameter  # type: ignore
 from .safety_manager import SafetyManager  # type: ignore
 from .learning_engine import LearningEngine  # type: ignore
+from .types import Severity  # type: ignore
 
 # Try to import additional types from their modules, with fallbacks
 try:
@@ -41,6 +42,7 @@ __all__ = [
     'SafetyManager',
     'SafetyValidationResult',
     'SafetyViolation',
+    'Severity',
     'LearningEngine',
     'SkillPerformance',
     'LearningInsight'
@@ -40,6 +40,7 @@ class ExecutionResult:
     execution_time: float = 0.0
     skills_used: Optional[List[str]] = None
     errors: Optional[List[str]] = None
+    intent: Optional[str] = None
 
 
 class MiktosAgent:
@@ -182,7 +183,8 @@ class MiktosAgent:
                 data=blender_result.data,
                 execution_time=execution_time,
                 skills_used=execution_plan.skills_used,
-                errors=blender_result.errors
+                errors=blender_result.errors,
+                intent=parsed_command.intent
             )
             
             # Store for learning (cast to avoid type conflicts)
@@ -12,7 +12,7 @@ import hashlib
 import json
 import pickle
 import time
-from typing import Any, Dict, List, Optional, Union, Callable, Set
+from typing import Any, Dict, List, Optional, Union, Callable, Set, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from collections import OrderedDict
@@ -33,9 +33,23 @@ try:
 except ImportError:
     TRANSFORMERS_AVAILABLE = False
 
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _serialize(value: Any) -> Optional[bytes]:
+    """Pickle a cache value once for size accounting and Redis, or None if it cannot be"""
+    try:
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+
+
 @dataclass
 class CacheEntry:
     """Cache entry with metadata"""
@@ -113,14 +127,13 @@ class MemoryCache:
             return None
     
     def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None, 
-            tags: Optional[Set[str]] = None) -> bool:
+            tags: Optional[Set[str]] = None, size_bytes: Optional[int] = None) -> bool:
         """Set item in cache"""
         with self.lock:
-            # Calculate size
-            try:
-                size_bytes = len(pickle.dumps(value))
-            except:
-                size_bytes = 1024  # Fallback estimate
+            # Calculate size unless the caller already serialized the value
+            if size_bytes is None:
+                data = _serialize(value)
+                size_bytes = len(data) if data is not None else 1024  # Fallback estimate
             
             # Check if single item exceeds memory limit
             if size_bytes > self.max_memory_bytes:
@@ -155,6 +168,22 @@ class MemoryCache:
             self._update_stats()
             return True
     
+    def touch(self, key: str) -> bool:
+        """Count a hit served by a faster tier and refresh the entry's LRU position"""
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return False
+            
+            entry.last_accessed = datetime.now()
+            entry.access_count += 1
+            self.cache.move_to_end(key)
+            
+            self.stats.total_requests += 1
+            self.stats.cache_hits += 1
+            self._update_stats()
+            return True
+    
     def delete(self, key: str) -> bool:
         """Delete item from cache"""
         with self.lock:
@@ -270,12 +299,19 @@ class RedisCache:
     
     async def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> bool:
         """Set item in Redis cache"""
+        data = _serialize(value)
+        if data is None:
+            logger.error(f"Redis set error: cannot serialize value for {key}")
+            return False
+        return await self.set_raw(key, data, ttl_seconds)
+    
+    async def set_raw(self, key: str, data: bytes, ttl_seconds: Optional[int] = None) -> bool:
+        """Set an already serialized item in Redis cache"""
         if not self.connected:
             return False
         
         try:
             redis_key = self._make_key(key)
-            data = pickle.dumps(value)
             
             if ttl_seconds:
                 self.client.setex(redis_key, ttl_seconds, data)
@@ -287,6 +323,39 @@ class RedisCache:
             logger.error(f"Redis set error: {e}")
             return False
     
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several items from Redis cache with a single MGET"""
+        if not self.connected or not keys:
+            return [None] * len(keys)
+        
+        try:
+            data = self.client.mget([self._make_key(key) for key in keys])
+            return [pickle.loads(item) if item else None for item in data]
+        except Exception as e:
+            logger.error(f"Redis mget error: {e}")
+            return [None] * len(keys)
+    
+    async def mset_raw(self, items: List[Tuple[str, bytes, Optional[int]]]) -> bool:
+        """Set several serialized (key, data, ttl_seconds) items in one pipelined round-trip"""
+        if not self.connected:
+            return False
+        
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, data, ttl_seconds in items:
+                redis_key = self._make_key(key)
+                
+                if ttl_seconds:
+                    pipe.setex(redis_key, ttl_seconds, data)
+                else:
+                    pipe.set(redis_key, data)
+            
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis mset error: {e}")
+            return False
+    
     async def delete(self, key: str) -> bool:
         """Delete item from Redis cache"""
         if not self.connected:
@@ -310,6 +379,11 @@ class SemanticCacheLayer:
         self.embeddings_cache = {}
         self.semantic_index = {}
         
+        # Normalized embedding matrix over semantic_index, rebuilt lazily after changes
+        self._index_keys: List[str] = []
+        self._index_matrix: Optional[np.ndarray] = None
+        self._faiss_index = None
+        
         if TRANSFORMERS_AVAILABLE:
             try:
                 self.model = SentenceTransformer('all-MiniLM-L6-v2')
@@ -331,29 +405,56 @@ class SemanticCacheLayer:
             logger.error(f"Failed to get embedding: {e}")
             return None
     
+    def _get_embeddings(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Get embeddings for several texts, encoding the uncached ones in one batch"""
+        try:
+            missing = [text for text in dict.fromkeys(texts) if text not in self.embeddings_cache]
+            if missing:
+                embeddings = self.model.encode(missing, batch_size=len(missing))
+                self.embeddings_cache.update(zip(missing, embeddings))
+            return np.vstack([self.embeddings_cache[text] for text in texts])
+        except Exception as e:
+            logger.error(f"Failed to get embeddings: {e}")
+            return None
+    
     def find_similar_keys(self, query: str, max_results: int = 5) -> List[str]:
         """Find semantically similar cache keys"""
-        if not self.model:
-            return []
-        
-        query_embedding = self._get_embedding(query)
-        if query_embedding is None:
-            return []
-        
-        similarities = []
-        for key, embedding in self.semantic_index.items():
-            try:
-                similarity = np.dot(query_embedding, embedding) / (
-                    np.linalg.norm(query_embedding) * np.linalg.norm(embedding)
-                )
-                if similarity >= self.similarity_threshold:
-                    similarities.append((key, similarity))
-            except Exception:
-                continue
-        
-        # Sort by similarity and return top results
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return [key for key, _ in similarities[:max_results]]
+        return self.find_similar_keys_batch([query], max_results)[0]
+    
+    def find_similar_keys_batch(self, queries: List[str], max_results: int = 5) -> List[List[str]]:
+        """Find semantically similar cache keys for several queries at once"""
+        results: List[List[str]] = [[] for _ in queries]
+        if not self.model or not self.semantic_index or not queries:
+            return results
+        
+        query_matrix = self._get_embeddings(queries)
+        if query_matrix is None:
+            return results
+        
+        query_matrix = query_matrix.astype(np.float32)
+        norms = np.linalg.norm(query_matrix, axis=1, keepdims=True)
+        valid = norms[:, 0] > 0
+        norms[~valid] = 1.0
+        query_matrix /= norms
+        
+        if self._index_matrix is None:
+            self._build_index()
+        
+        # Inner product of unit vectors is cosine similarity
+        k = min(max_results, len(self._index_keys))
+        if self._faiss_index is not None:
+            scores, ids = self._faiss_index.search(query_matrix, k)
+        else:
+            similarities = query_matrix @ self._index_matrix.T
+            ids = np.argsort(-similarities, axis=1)[:, :k]
+            scores = np.take_along_axis(similarities, ids, axis=1)
+        
+        for row in np.flatnonzero(valid):
+            results[row] = [
+                self._index_keys[i] for i, similarity in zip(ids[row], scores[row])
+                if i >= 0 and similarity >= self.similarity_threshold
+            ]
+        return results
     
     def index_key(self, key: str, text_content: str):
         """Add key to semantic index"""
@@ -363,6 +464,26 @@ class SemanticCacheLayer:
         embedding = self._get_embedding(text_content)
         if embedding is not None:
             self.semantic_index[key] = embedding
+            self._index_matrix = None
+    
+    def remove_key(self, key: str):
+        """Remove key from semantic index"""
+        if self.semantic_index.pop(key, None) is not None:
+            self._index_matrix = None
+    
+    def _build_index(self):
+        """Stack the indexed embeddings into a normalized matrix (and FAISS index)"""
+        self._index_keys = list(self.semantic_index)
+        matrix = np.vstack([self.semantic_index[key] for key in self._index_keys]).astype(np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        
+        self._faiss_index = None
+        if FAISS_AVAILABLE:
+            self._faiss_index = faiss.IndexFlatIP(matrix.shape[1])
+            self._faiss_index.add(matrix)
+        self._index_matrix = matrix
 
 
 class CacheWarmer:
@@ -462,6 +583,12 @@ class CacheManager:
         self.default_ttl = self.config.get('default_ttl', 3600)
         self.enable_statistics = self.config.get('enable_statistics', True)
         
+        # Short-lived L1 in front of all tiers: cache_key -> (expires_at, value)
+        self._l1 = OrderedDict()
+        self._l1_ttl = self.config.get('l1_ttl_seconds', 1.0)
+        self._l1_max_entries = self.config.get('l1_max_entries', 1024)
+        self._l1_hits = 0
+        
         # Performance monitoring integration
         self.performance_monitor = None
         
@@ -477,9 +604,17 @@ class CacheManager:
         cache_key = f"{namespace}:{key}"
         start_time = time.time()
         
+        # Try the L1 for keys read within the last moment
+        value = self._l1_get(cache_key)
+        if value is not None:
+            self._record_l1_hit(cache_key)
+            self._record_cache_hit("l1", time.time() - start_time)
+            return value
+        
         # Try memory cache first
         value = self.memory_cache.get(cache_key)
         if value is not None:
+            self._l1_put(cache_key, value)
             self._record_cache_hit("memory", time.time() - start_time)
             self.cache_warmer.record_access(cache_key, {"source": "memory"})
             return value
@@ -490,37 +625,123 @@ class CacheManager:
             if value is not None:
                 # Populate memory cache
                 self.memory_cache.set(cache_key, value, ttl_seconds=self.default_ttl)
+                self._l1_put(cache_key, value)
                 self._record_cache_hit("redis", time.time() - start_time)
                 self.cache_warmer.record_access(cache_key, {"source": "redis"})
                 return value
         
         # Try semantic similarity if enabled
-        if self.semantic_cache and isinstance(key, str):
-            similar_keys = self.semantic_cache.find_similar_keys(key)
+        value = await self._get_semantic(key, namespace)
+        if value is not None:
+            self._record_cache_hit("semantic", time.time() - start_time)
+            return value
+        
+        self._record_cache_miss(time.time() - start_time)
+        return None
+    
+    async def mget(self, keys: List[str], namespace: str = "default") -> List[Optional[Any]]:
+        """Get several items from one namespace with a single lookup per tier"""
+        cache_keys = [f"{namespace}:{key}" for key in keys]
+        start_time = time.time()
+        
+        # Try the L1, then the memory cache
+        values = []
+        sources = []
+        for cache_key in cache_keys:
+            value = self._l1_get(cache_key)
+            source = "l1"
+            if value is None:
+                value = self.memory_cache.get(cache_key)
+                source = "memory"
+            values.append(value)
+            sources.append(source if value is not None else None)
+        
+        # Fetch everything the memory cache missed from Redis in one MGET
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing and self.redis_cache:
+            fetched = await self.redis_cache.mget([cache_keys[i] for i in missing])
+            for i, value in zip(missing, fetched):
+                if value is not None:
+                    # Populate memory cache
+                    self.memory_cache.set(cache_keys[i], value, ttl_seconds=self.default_ttl)
+                    values[i] = value
+                    sources[i] = "redis"
+        
+        for cache_key, value, source in zip(cache_keys, values, sources):
+            if source in ("memory", "redis"):
+                self._l1_put(cache_key, value)
+        
+        # Remaining misses fall back to semantic similarity, embedded as one batch
+        missing = [i for i, source in enumerate(sources) if source is None]
+        if missing:
+            found = await self._get_semantic_batch([keys[i] for i in missing], namespace)
+            for i, value in zip(missing, found):
+                if value is not None:
+                    values[i] = value
+                    sources[i] = "semantic"
+        
+        duration = time.time() - start_time
+        for cache_key, source in zip(cache_keys, sources):
+            if source is None:
+                self._record_cache_miss(duration)
+            else:
+                self._record_cache_hit(source, duration)
+                if source == "l1":
+                    self._record_l1_hit(cache_key)
+                elif source in ("memory", "redis"):
+                    self.cache_warmer.record_access(cache_key, {"source": source})
+        
+        return values
+    
+    async def _get_semantic(self, key: str, namespace: str) -> Optional[Any]:
+        """Look up a value stored under a semantically similar key"""
+        return (await self._get_semantic_batch([key], namespace))[0]
+    
+    async def _get_semantic_batch(self, keys: List[str], namespace: str) -> List[Optional[Any]]:
+        """Look up values stored under keys semantically similar to each of the given keys"""
+        values: List[Optional[Any]] = [None] * len(keys)
+        if not self.semantic_cache:
+            return values
+        
+        positions = [i for i, key in enumerate(keys) if isinstance(key, str)]
+        if not positions:
+            return values
+        
+        similar = self.semantic_cache.find_similar_keys_batch([keys[i] for i in positions])
+        for i, similar_keys in zip(positions, similar):
             for similar_key in similar_keys:
                 similar_cache_key = f"{namespace}:{similar_key}"
                 value = self.memory_cache.get(similar_cache_key)
                 if value is not None:
                     # Cache under the requested key too
-                    await self.set(key, value, namespace=namespace)
-                    self._record_cache_hit("semantic", time.time() - start_time)
-                    return value
-        
-        self._record_cache_miss(time.time() - start_time)
-        return None
+                    await self.set(keys[i], value, namespace=namespace)
+                    values[i] = value
+                    break
+        return values
     
     async def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None,
                   namespace: str = "default", tags: Optional[Set[str]] = None) -> bool:
         """Set item in cache across all tiers"""
         cache_key = f"{namespace}:{key}"
         ttl = ttl_seconds or self.default_ttl
+        self._l1.pop(cache_key, None)
+        
+        # Serialize once; the same bytes size the memory entry and go to Redis
+        data = _serialize(value) if self.redis_cache else None
         
         # Set in memory cache
-        success = self.memory_cache.set(cache_key, value, ttl_seconds=ttl, tags=tags)
+        success = self.memory_cache.set(
+            cache_key, value, ttl_seconds=ttl, tags=tags,
+            size_bytes=len(data) if data is not None else None
+        )
         
-        # Set in Redis cache
-        if self.redis_cache:
-            await self.redis_cache.set(cache_key, value, ttl_seconds=ttl)
+        # Set in Redis cache; a value that cannot be pickled stays in memory only
+        if self.redis_cache and self.redis_cache.connected:
+            if data is None:
+                logger.warning(f"Cannot serialize value for {cache_key}; not stored in Redis")
+                success = False
+            elif not await self.redis_cache.set_raw(cache_key, data, ttl_seconds=ttl):
+                success = False
         
         # Index in semantic cache if applicable
         if self.semantic_cache and isinstance(key, str):
@@ -529,9 +750,59 @@ class CacheManager:
         
         return success
     
+    async def mset(self, items: List[Tuple[str, Any, Optional[int]]], namespace: str = "default",
+                   tags: Optional[Set[str]] = None) -> List[bool]:
+        """Set several (key, value, ttl_seconds) items in one namespace across all tiers"""
+        entries = [
+            (f"{namespace}:{key}", value, ttl_seconds or self.default_ttl)
+            for key, value, ttl_seconds in items
+        ]
+        
+        for cache_key, _, _ in entries:
+            self._l1.pop(cache_key, None)
+        
+        # Serialize once; the same bytes size the memory entries and go to Redis
+        payloads = [_serialize(value) if self.redis_cache else None for _, value, _ in entries]
+        
+        # Set in memory cache
+        results = [
+            self.memory_cache.set(
+                cache_key, value, ttl_seconds=ttl, tags=tags,
+                size_bytes=len(data) if data is not None else None
+            )
+            for (cache_key, value, ttl), data in zip(entries, payloads)
+        ]
+        
+        # Set in Redis cache with a single pipeline; values that cannot be
+        # pickled stay in memory only and are reported as not stored
+        raw_entries = [
+            (cache_key, data, ttl)
+            for (cache_key, _, ttl), data in zip(entries, payloads)
+            if data is not None
+        ]
+        if self.redis_cache and self.redis_cache.connected:
+            unserializable = [cache_key for (cache_key, _, _), data in zip(entries, payloads) if data is None]
+            if unserializable:
+                logger.warning(f"Cannot serialize values for {unserializable}; not stored in Redis")
+            redis_stored = not raw_entries or await self.redis_cache.mset_raw(raw_entries)
+            results = [
+                stored and redis_stored and data is not None
+                for stored, data in zip(results, payloads)
+            ]
+        
+        # Index in semantic cache if applicable
+        if self.semantic_cache:
+            for key, value, _ in items:
+                if isinstance(key, str):
+                    text_content = str(value) if not isinstance(value, str) else value
+                    self.semantic_cache.index_key(key, text_content)
+        
+        return results
+    
     async def delete(self, key: str, namespace: str = "default") -> bool:
         """Delete item from all cache tiers"""
         cache_key = f"{namespace}:{key}"
+        self._l1.pop(cache_key, None)
         
         # Delete from memory cache
         memory_deleted = self.memory_cache.delete(cache_key)
@@ -542,8 +813,8 @@ class CacheManager:
             redis_deleted = await self.redis_cache.delete(cache_key)
         
         # Remove from semantic index
-        if self.semantic_cache and key in self.semantic_cache.semantic_index:
-            del self.semantic_cache.semantic_index[key]
+        if self.semantic_cache:
+            self.semantic_cache.remove_key(key)
         
         return memory_deleted or redis_deleted
     
@@ -553,6 +824,9 @@ class CacheManager:
         # In a real system, you'd need more sophisticated namespace handling
         removed_count = 0
         
+        for key in [k for k in self._l1 if k.startswith(f"{namespace}:")]:
+            del self._l1[key]
+        
         # Clear from memory cache (approximate)
         keys_to_remove = [k for k in self.memory_cache.cache.keys() if k.startswith(f"{namespace}:")]
         for key in keys_to_remove:
@@ -563,6 +837,7 @@ class CacheManager:
     
     async def clear_by_tags(self, tags: Set[str]) -> int:
         """Clear all items with specified tags"""
+        self._l1.clear()
         return self.memory_cache.clear_by_tags(tags)
     
     def get_stats(self) -> Dict[str, Any]:
@@ -574,6 +849,8 @@ class CacheManager:
             'redis_connected': self.redis_cache.connected if self.redis_cache else False,
             'semantic_enabled': self.semantic_cache is not None,
             'total_namespaces': len(set(k.split(':')[0] for k in self.memory_cache.cache.keys())),
+            'l1_entries': len(self._l1),
+            'l1_hits': self._l1_hits,
         }
         
         if self.semantic_cache:
@@ -581,6 +858,32 @@ class CacheManager:
         
         return stats
     
+    def _l1_get(self, cache_key: str) -> Optional[Any]:
+        """Get a value from the L1 if it has not expired yet"""
+        entry = self._l1.get(cache_key)
+        if entry is None:
+            return None
+        
+        if entry[0] < time.monotonic():
+            del self._l1[cache_key]
+            return None
+        
+        self._l1.move_to_end(cache_key)
+        return entry[1]
+    
+    def _l1_put(self, cache_key: str, value: Any):
+        """Remember a value read from a lower tier for the L1 TTL"""
+        self._l1[cache_key] = (time.monotonic() + self._l1_ttl, value)
+        self._l1.move_to_end(cache_key)
+        while len(self._l1) > self._l1_max_entries:
+            self._l1.popitem(last=False)
+    
+    def _record_l1_hit(self, cache_key: str):
+        """Account an L1 hit as a memory cache access so warming, LRU order and hit_rate see it"""
+        self._l1_hits += 1
+        self.memory_cache.touch(cache_key)
+        self.cache_warmer.record_access(cache_key, {"source": "l1"})
+    
     def _record_cache_hit(self, source: str, duration: float):
         """Record cache hit for monitoring"""
         if self.performance_monitor:
@@ -68,6 +68,7 @@ class ParsedCommand:
     required_skills: Optional[List[str]] = None
     dependencies: Optional[List[str]] = None
     metadata: Optional[Dict[str, Any]] = None
+    operation_type: Any = None  # safety_manager.OperationType, cached on first validation
 
 
 class CommandParser:
@@ -0,0 +1,65 @@
+"""
+Config Cache for Miktos AI Bridge Platform
+
+Parses YAML config files through a JSON sidecar, so repeated runs skip the
+YAML parser while the source file is unchanged.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _Loader  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+def sidecar_path(config_path: Union[str, Path]) -> Path:
+    """Path of the JSON sidecar kept next to a YAML config file"""
+    config_path = Path(config_path)
+    return config_path.with_name(config_path.name + '.cache.json')
+
+
+def load_yaml_config(config_path: Union[str, Path]) -> Dict[str, Any]:
+    """Parse a YAML config, reusing its JSON sidecar while the file is unchanged"""
+    config_path = Path(config_path)
+    cache_path = sidecar_path(config_path)
+    st = config_path.stat()
+    # The sidecar is only trusted for the exact mtime and size it was built from
+    source = [st.st_mtime_ns, st.st_size]
+    
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached['source'] == source:
+            return cached['config']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=_Loader)
+    
+    # Best effort: read-only filesystems or non-JSON values just skip the sidecar.
+    # JSON turns non-string keys into strings and tuples into lists, so a
+    # config that does not survive the round trip unchanged is not cached
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        payload = json.dumps({'source': source, 'config': config}, separators=(',', ':'))
+        if json.loads(payload)['config'] != config:
+            raise ValueError("config does not survive a JSON round trip")
+        tmp_path.write_text(payload)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+    
+    return config
@@ -19,9 +19,25 @@ from enum import Enum
 import threading
 import math
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _steps_over_share(step_timings, share: float) -> List[int]:
+    """Indices of the steps taking more than `share` of the total step time"""
+    if NUMPY_AVAILABLE:
+        timings = np.asarray(step_timings, dtype=np.float64)
+        return np.flatnonzero(timings > timings.sum() * share).tolist()
+    
+    total_time = sum(step_timings)
+    return [i for i, timing in enumerate(step_timings) if timing > total_time * share]
+
+
 class OptimizationStrategy(Enum):
     """Available optimization strategies"""
     AGGRESSIVE = "aggressive"          # Maximum performance, higher resource usage
@@ -407,16 +423,11 @@ class WorkflowOptimizer:
         else:
             stats['avg_steps'] = execution_data.get('steps', 0)
         
-        # Identify bottlenecks
+        # Identify bottlenecks; step_timings may be a list or a NumPy array
         step_timings = execution_data.get('step_timings', [])
-        if step_timings:
+        if len(step_timings):
             # Find steps taking more than 20% of total time
-            total_time = sum(step_timings)
-            bottlenecks = [
-                i for i, timing in enumerate(step_timings)
-                if timing > total_time * 0.2
-            ]
-            stats['bottlenecks'] = bottlenecks
+            stats['bottlenecks'] = _steps_over_share(step_timings, 0.2)
         
         # Generate optimization suggestions
         suggestions = []
@@ -442,10 +453,7 @@ class WorkflowOptimizer:
             return None
         
         # Look for expensive steps that could be moved earlier for early failure
-        expensive_steps = [
-            i for i, timing in enumerate(step_timings)
-            if timing > sum(step_timings) * 0.3
-        ]
+        expensive_steps = _steps_over_share(step_timings, 0.3)
         
         if expensive_steps and expensive_steps[0] > len(step_timings) * 0.5:
             return {
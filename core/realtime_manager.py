@@ -11,7 +11,7 @@ import logging
 import json
 import time
 import uuid
-from typing import Dict, List, Any, Optional, Set, Callable, Union
+from typing import Dict, List, Any, Optional, Set, Callable, Union, Tuple
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from collections import defaultdict
@@ -24,9 +24,29 @@ try:
 except ImportError:
     WEBSOCKETS_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps(obj: Any) -> str:
+    """Encode a message payload as JSON text, via orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Decode an incoming JSON message; orjson's decode error subclasses json.JSONDecodeError"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class MessageType(Enum):
     """Real-time message types"""
     # User management
@@ -37,6 +57,7 @@ class MessageType(Enum):
     # Workflow collaboration
     WORKFLOW_STARTED = "workflow_started"
     WORKFLOW_PROGRESS = "workflow_progress"
+    WORKFLOW_PROGRESS_BATCH = "workflow_progress_batch"
     WORKFLOW_COMPLETED = "workflow_completed"
     WORKFLOW_ERROR = "workflow_error"
     
@@ -384,7 +405,7 @@ class RealtimeManager:
         try:
             # Wait for authentication message
             auth_message = await asyncio.wait_for(websocket.recv(), timeout=30)
-            auth_data = json.loads(auth_message)
+            auth_data = _json_loads(auth_message)
             
             if auth_data.get('type') != 'authenticate':
                 await websocket.close(code=4001, reason="Authentication required")
@@ -466,7 +487,7 @@ class RealtimeManager:
         
         # Parse message
         try:
-            message_data = json.loads(raw_message)
+            message_data = _json_loads(raw_message)
         except json.JSONDecodeError:
             await self._send_error(connection_id, "Invalid JSON message")
             return
@@ -718,22 +739,35 @@ class RealtimeManager:
                 logger.error(f"Cleanup task error: {e}")
                 await asyncio.sleep(60)
     
+    @staticmethod
+    def _encode_message(message: RealtimeMessage) -> str:
+        """Serialize a message into its wire format"""
+        return _json_dumps({
+            'message_id': message.message_id,
+            'type': message.type.value,
+            'sender_id': message.sender_id,
+            'data': message.data,
+            'timestamp': message.timestamp.isoformat()
+        })
+    
     async def _send_to_user(self, connection_id: str, message: RealtimeMessage):
         """Send message to specific user"""
+        try:
+            message_json = self._encode_message(message)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to encode {message.type.value} message: {e}")
+            return
+        
+        await self._send_raw(connection_id, message_json)
+    
+    async def _send_raw(self, connection_id: str, payload: Union[str, bytes]):
+        """Send an already-encoded message to specific user"""
         user = self.connected_users.get(connection_id)
         if not user:
             return
         
         try:
-            message_json = json.dumps({
-                'message_id': message.message_id,
-                'type': message.type.value,
-                'sender_id': message.sender_id,
-                'data': message.data,
-                'timestamp': message.timestamp.isoformat()
-            })
-            
-            await user.websocket.send(message_json)
+            await user.websocket.send(payload)
         except Exception as e:
             logger.error(f"Failed to send message to {connection_id}: {e}")
             await self._cleanup_connection(connection_id, user.user_id)
@@ -741,6 +775,7 @@ class RealtimeManager:
     async def _broadcast_message(self, message: RealtimeMessage, exclude_user: Optional[str] = None):
         """Broadcast message to all connected users"""
         tasks = []
+        message_json = None
         
         for connection_id, user in self.connected_users.items():
             if exclude_user and user.user_id == exclude_user:
@@ -749,7 +784,14 @@ class RealtimeManager:
             if message.target_users and user.user_id not in message.target_users:
                 continue
             
-            tasks.append(self._send_to_user(connection_id, message))
+            # Encode once for every recipient
+            if message_json is None:
+                try:
+                    message_json = self._encode_message(message)
+                except (TypeError, ValueError) as e:
+                    logger.error(f"Failed to encode {message.type.value} message: {e}")
+                    return
+            tasks.append(self._send_raw(connection_id, message_json))
         
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
@@ -868,6 +910,48 @@ class RealtimeManager:
             timestamp=datetime.now()
         ))
     
+    async def broadcast_workflow_progress_batch(self, workflow_id: str,
+                                              updates: List[Tuple[float, int, int]]):
+        """Broadcast several (progress, current_step, total_steps) updates in one message"""
+        await self._broadcast_message(RealtimeMessage(
+            message_id=str(uuid.uuid4()),
+            type=MessageType.WORKFLOW_PROGRESS_BATCH,
+            sender_id="system",
+            data={
+                'workflow_id': workflow_id,
+                'updates': [
+                    {
+                        'progress': progress,
+                        'current_step': current_step,
+                        'total_steps': total_steps
+                    }
+                    for progress, current_step, total_steps in updates
+                ]
+            },
+            timestamp=datetime.now()
+        ))
+    
+    def encode_message(self, message_type: MessageType, data: Dict[str, Any],
+                       sender_id: str = "system") -> str:
+        """Encode a message once for repeated use with broadcast_raw"""
+        return self._encode_message(RealtimeMessage(
+            message_id=str(uuid.uuid4()),
+            type=message_type,
+            sender_id=sender_id,
+            data=data,
+            timestamp=datetime.now()
+        ))
+    
+    async def broadcast_raw(self, payload: Union[str, bytes]):
+        """Send an already-encoded message to every connected user without re-encoding it"""
+        tasks = [
+            self._send_raw(connection_id, payload)
+            for connection_id in list(self.connected_users)
+        ]
+        
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
     async def broadcast_system_status(self, status: Dict[str, Any]):
         """Broadcast system status to all users"""
         await self._broadcast_message(RealtimeMessage(
@@ -9,11 +9,26 @@ and rollback capabilities.
 import json
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any, Union
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Union, Mapping, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
+from .types import Severity  # type: ignore
+
+# Parameter limits for safety validation: name -> (min, max, warning_threshold)
+_PARAM_LIMITS: Mapping[str, Tuple[float, float, float]] = MappingProxyType({
+    'scale': (0.001, 1000.0, 100.0),
+    'rotation': (-360.0, 360.0, 180.0),
+    'subdivisions': (0, 6, 4),
+    'array_count': (1, 100, 50),
+    'extrude_distance': (0.0, 1000.0, 100.0),
+    'bevel_offset': (0.0, 10.0, 5.0),
+    'particle_count': (1, 100000, 10000),
+})
+
+
 # Local type definitions compatible with command_parser
 @dataclass
 class ParsedParameter:
@@ -57,6 +72,7 @@ class ParsedCommand:
     required_skills: Optional[List[str]] = None
     dependencies: Optional[List[str]] = None
     metadata: Optional[Dict[str, Any]] = None
+    operation_type: Optional['OperationType'] = None
 
 
 class SafetyLevel(Enum):
@@ -83,20 +99,26 @@ class SafetyRule:
     name: str
     description: str
     operation_types: List[OperationType]
-    severity: str  # "error", "warning", "info"
+    severity: Severity
     validator_function: str
     parameters: Optional[Dict[str, Any]] = None
+    
+    def __post_init__(self):
+        self.severity = Severity.coerce(self.severity)
 
 
 @dataclass
 class SafetyViolation:
     """Represents a safety rule violation"""
     rule_name: str
-    severity: str
+    severity: Severity
     message: str
     parameter: Optional[str] = None
     suggested_fix: Optional[str] = None
     auto_fixable: bool = False
+    
+    def __post_init__(self):
+        self.severity = Severity.coerce(self.severity)
 
 
 @dataclass
@@ -118,6 +140,22 @@ class SafetyManager:
     Validates commands against safety rules and provides rollback capabilities.
     """
     
+    # Rollback operations per operation type
+    _ROLLBACK_TEMPLATES: Dict[OperationType, Tuple[Dict[str, str], ...]] = {
+        OperationType.CREATE: ({
+            "type": "delete_created_objects",
+            "description": "Remove objects created by this command"
+        },),
+        OperationType.MODIFY: ({
+            "type": "restore_object_state",
+            "description": "Restore objects to previous state"
+        },),
+        OperationType.DELETE: ({
+            "type": "restore_deleted_objects",
+            "description": "Restore deleted objects from backup"
+        },),
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = logging.getLogger('SafetyManager')
@@ -140,7 +178,7 @@ class SafetyManager:
         self.blacklisted_operations = config.get('blacklisted_operations', [])
         
         # Parameter limits
-        self.parameter_limits = self._init_parameter_limits()
+        self.parameter_limits = _PARAM_LIMITS
     
     def _get_parameters_dict(self, parsed_command: ParsedCommand) -> Dict[str, ParsedParameter]:
         """Convert parameters list to dict for compatibility"""
@@ -210,7 +248,7 @@ class SafetyManager:
             name="destructive_operation_warning",
             description="Warn before destructive operations",
             operation_types=[OperationType.DELETE],
-            severity="warning",
+            severity=Severity.WARNING,
             validator_function="validate_destructive_operation"
         ))
         
@@ -219,7 +257,7 @@ class SafetyManager:
             name="parameter_range_validation",
             description="Validate parameter ranges",
             operation_types=[OperationType.CREATE, OperationType.MODIFY],
-            severity="error",
+            severity=Severity.ERROR,
             validator_function="validate_parameter_ranges"
         ))
         
@@ -228,7 +266,7 @@ class SafetyManager:
             name="object_count_limit",
             description="Prevent excessive object creation",
             operation_types=[OperationType.CREATE],
-            severity="error",
+            severity=Severity.ERROR,
             validator_function="validate_object_count",
             parameters={"max_objects_per_operation": 100}
         ))
@@ -238,7 +276,7 @@ class SafetyManager:
             name="resource_protection",
             description="Protect system resources",
             operation_types=[OperationType.CREATE, OperationType.MODIFY],
-            severity="error",
+            severity=Severity.ERROR,
             validator_function="validate_resource_usage"
         ))
         
@@ -247,7 +285,7 @@ class SafetyManager:
             name="subdivision_limit",
             description="Prevent excessive subdivision",
             operation_types=[OperationType.MODIFY],
-            severity="error",
+            severity=Severity.ERROR,
             validator_function="validate_subdivision_levels",
             parameters={"max_subdivisions": 6}
         ))
@@ -257,7 +295,7 @@ class SafetyManager:
             name="file_system_safety",
             description="Prevent unauthorized file operations",
             operation_types=[OperationType.SYSTEM],
-            severity="error",
+            severity=Severity.ERROR,
             validator_function="validate_file_operations"
         ))
         
@@ -266,53 +304,13 @@ class SafetyManager:
             name="animation_frame_limit",
             description="Prevent excessive animation frames",
             operation_types=[OperationType.CREATE, OperationType.MODIFY],
-            severity="warning",
+            severity=Severity.WARNING,
             validator_function="validate_animation_frames",
             parameters={"max_frames": 10000}
         ))
         
         return rules
     
-    def _init_parameter_limits(self) -> Dict[str, Dict[str, Union[int, float]]]:
-        """Initialize parameter limits for safety validation"""
-        return {
-            'scale': {
-                'min': 0.001,
-                'max': 1000.0,
-                'warning_threshold': 100.0
-            },
-            'rotation': {
-                'min': -360.0,
-                'max': 360.0,
-                'warning_threshold': 180.0
-            },
-            'subdivisions': {
-                'min': 0,
-                'max': 6,
-                'warning_threshold': 4
-            },
-            'array_count': {
-                'min': 1,
-                'max': 100,
-                'warning_threshold': 50
-            },
-            'extrude_distance': {
-                'min': 0.0,
-                'max': 1000.0,
-                'warning_threshold': 100.0
-            },
-            'bevel_offset': {
-                'min': 0.0,
-                'max': 10.0,
-                'warning_threshold': 5.0
-            },
-            'particle_count': {
-                'min': 1,
-                'max': 100000,
-                'warning_threshold': 10000
-            }
-        }
-    
     async def validate_command(self, parsed_command: ParsedCommand) -> SafetyValidationResult:
         """
         Validate a parsed command against safety rules
@@ -330,7 +328,7 @@ class SafetyManager:
         
         try:
             # Determine operation type
-            operation_type = self._determine_operation_type(parsed_command)
+            operation_type = self._get_operation_type(parsed_command)
             
             # Check if operation is blacklisted
             if self._is_blacklisted_operation(parsed_command):
@@ -339,7 +337,7 @@ class SafetyManager:
                     safety_level=self.validation_level,
                     violations=[SafetyViolation(
                         rule_name="blacklisted_operation",
-                        severity="error",
+                        severity=Severity.ERROR,
                         message="Operation is blacklisted",
                         suggested_fix="Use an alternative approach"
                     )],
@@ -375,7 +373,7 @@ class SafetyManager:
             # Create reason if unsafe
             reason = None
             if not is_safe:
-                error_violations = [v for v in violations if v.severity == "error"]
+                error_violations = [v for v in violations if v.severity is Severity.ERROR]
                 if error_violations:
                     reason = f"Safety violations: {', '.join([v.rule_name for v in error_violations])}"
             
@@ -397,7 +395,7 @@ class SafetyManager:
                 safety_level=self.validation_level,
                 violations=[SafetyViolation(
                     rule_name="validation_error",
-                    severity="error",
+                    severity=Severity.ERROR,
                     message=f"Safety validation failed: {str(e)}"
                 )],
                 warnings=[],
@@ -407,6 +405,17 @@ class SafetyManager:
                 confidence=0.0
             )
     
+    def _get_operation_type(self, parsed_command: ParsedCommand) -> OperationType:
+        """Get the operation type, determining it once per command"""
+        operation_type = getattr(parsed_command, 'operation_type', None)
+        if operation_type is None:
+            operation_type = self._determine_operation_type(parsed_command)
+            try:
+                parsed_command.operation_type = operation_type
+            except AttributeError:
+                pass
+        return operation_type
+    
     def _determine_operation_type(self, parsed_command: ParsedCommand) -> OperationType:
         """Determine the type of operation for safety classification"""
         intent = self._get_primary_intent(parsed_command).lower()
@@ -454,7 +463,7 @@ class SafetyManager:
             self.logger.error(f"Error applying safety rule {rule.name}: {e}")
             violations.append(SafetyViolation(
                 rule_name=rule.name,
-                severity="error",
+                severity=Severity.ERROR,
                 message=f"Rule validation failed: {str(e)}"
             ))
         
@@ -471,7 +480,7 @@ class SafetyManager:
             if not metadata.get('user_confirmed', False):
                 violations.append(SafetyViolation(
                     rule_name=rule.name,
-                    severity="warning",
+                    severity=Severity.WARNING,
                     message="Destructive operation requires user confirmation",
                     suggested_fix="Add confirmation flag or use safer alternative",
                     auto_fixable=False
@@ -491,34 +500,34 @@ class SafetyManager:
                     
                 if self._get_param_type(param) == 'numeric':
                     # Check if parameter has defined limits
-                    for limit_name, limits in self.parameter_limits.items():
+                    for limit_name, (lo, hi, threshold) in self.parameter_limits.items():
                         if limit_name in param_name.lower():
                             value = self._safe_get_param_value(param)
                             
                             if value is not None:
-                                if value < limits['min'] or value > limits['max']:
+                                if value < lo or value > hi:
                                     violations.append(SafetyViolation(
                                         rule_name=rule.name,
-                                        severity="error",
-                                        message=f"Parameter {param_name} value {value} outside safe range [{limits['min']}, {limits['max']}]",
+                                        severity=Severity.ERROR,
+                                        message=f"Parameter {param_name} value {value} outside safe range [{lo}, {hi}]",
                                         parameter=param_name,
-                                        suggested_fix=f"Use value between {limits['min']} and {limits['max']}",
+                                        suggested_fix=f"Use value between {lo} and {hi}",
                                         auto_fixable=True
                                     ))
-                                elif value > limits.get('warning_threshold', limits['max']):
+                                elif value > threshold:
                                     violations.append(SafetyViolation(
                                         rule_name=rule.name,
-                                        severity="warning",
-                                        message=f"Parameter {param_name} value {value} exceeds recommended threshold {limits['warning_threshold']}",
+                                        severity=Severity.WARNING,
+                                        message=f"Parameter {param_name} value {value} exceeds recommended threshold {threshold}",
                                         parameter=param_name,
-                                        suggested_fix=f"Consider using value below {limits['warning_threshold']}",
+                                        suggested_fix=f"Consider using value below {threshold}",
                                         auto_fixable=True
                                     ))
         except Exception as e:
             self.logger.error(f"Error in parameter range validation: {e}")
             violations.append(SafetyViolation(
                 rule_name=rule.name,
-                severity="error",
+                severity=Severity.ERROR,
                 message=f"Parameter validation failed: {str(e)}",
                 auto_fixable=False
             ))
@@ -544,7 +553,7 @@ class SafetyManager:
                         if value is not None and value > max_objects:
                             violations.append(SafetyViolation(
                                 rule_name=rule.name,
-                                severity="error",
+                                severity=Severity.ERROR,
                                 message=f"Object count {value} exceeds maximum {max_objects}",
                                 parameter=param_name,
                                 suggested_fix=f"Reduce count to {max_objects} or less",
@@ -554,7 +563,7 @@ class SafetyManager:
             self.logger.error(f"Error in object count validation: {e}")
             violations.append(SafetyViolation(
                 rule_name=rule.name,
-                severity="error",
+                severity=Severity.ERROR,
                 message=f"Object count validation failed: {str(e)}",
                 auto_fixable=False
             ))
@@ -571,7 +580,7 @@ class SafetyManager:
         if resource_score > 0.8:
             violations.append(SafetyViolation(
                 rule_name=rule.name,
-                severity="warning",
+                severity=Severity.WARNING,
                 message=f"High resource usage expected (score: {resource_score:.2f})",
                 suggested_fix="Consider breaking operation into smaller steps",
                 auto_fixable=False
@@ -596,7 +605,7 @@ class SafetyManager:
                     if value is not None and value > max_subdivisions:
                         violations.append(SafetyViolation(
                             rule_name=rule.name,
-                            severity="error",
+                            severity=Severity.ERROR,
                             message=f"Subdivision level {value} exceeds maximum {max_subdivisions}",
                             parameter=param_name,
                             suggested_fix=f"Use {max_subdivisions} or fewer subdivisions",
@@ -606,7 +615,7 @@ class SafetyManager:
             self.logger.error(f"Error in subdivision validation: {e}")
             violations.append(SafetyViolation(
                 rule_name=rule.name,
-                severity="error",
+                severity=Severity.ERROR,
                 message=f"Subdivision validation failed: {str(e)}",
                 auto_fixable=False
             ))
@@ -625,7 +634,7 @@ class SafetyManager:
             if keyword in text_lower:
                 violations.append(SafetyViolation(
                     rule_name=rule.name,
-                    severity="warning",
+                    severity=Severity.WARNING,
                     message=f"File operation detected: {keyword}",
                     suggested_fix="Ensure file paths are safe and authorized",
                     auto_fixable=False
@@ -652,7 +661,7 @@ class SafetyManager:
                     if value is not None and value > max_frames:
                         violations.append(SafetyViolation(
                             rule_name=rule.name,
-                            severity="warning",
+                            severity=Severity.WARNING,
                             message=f"Frame count {value} exceeds recommended maximum {max_frames}",
                             parameter=param_name,
                             suggested_fix=f"Consider using {max_frames} or fewer frames",
@@ -662,7 +671,7 @@ class SafetyManager:
             self.logger.error(f"Error in animation frame validation: {e}")
             violations.append(SafetyViolation(
                 rule_name=rule.name,
-                severity="error",
+                severity=Severity.ERROR,
                 message=f"Animation frame validation failed: {str(e)}",
                 auto_fixable=False
             ))
@@ -677,7 +686,7 @@ class SafetyManager:
         if parsed_command.execution_complexity > 0.9:
             violations.append(SafetyViolation(
                 rule_name="complexity_warning",
-                severity="warning",
+                severity=Severity.WARNING,
                 message=f"Very high execution complexity: {parsed_command.execution_complexity:.2f}",
                 suggested_fix="Consider breaking into simpler commands",
                 auto_fixable=False
@@ -688,7 +697,7 @@ class SafetyManager:
         if required_skills_count > self.max_operations_per_command:
             violations.append(SafetyViolation(
                 rule_name="operation_count_limit",
-                severity="error",
+                severity=Severity.ERROR,
                 message=f"Too many operations required: {required_skills_count}",
                 suggested_fix=f"Limit to {self.max_operations_per_command} operations per command",
                 auto_fixable=False
@@ -745,12 +754,12 @@ class SafetyManager:
                         try:
                             # Auto-correct parameter ranges
                             if "outside safe range" in violation.message:
-                                for limit_name, limits in self.parameter_limits.items():
+                                for limit_name, (lo, hi, _) in self.parameter_limits.items():
                                     if limit_name in violation.parameter.lower():
                                         # Clamp to safe range
                                         param_value = self._safe_get_param_value(param)
                                         if param_value is not None:
-                                            corrected_value = max(limits['min'], min(param_value, limits['max']))
+                                            corrected_value = max(lo, min(param_value, hi))
                                             corrections[violation.parameter] = corrected_value
                                         break
                         except Exception as e:
@@ -768,8 +777,7 @@ class SafetyManager:
         
         # Require rollback for destructive operations with errors
         if operation_type == OperationType.DELETE:
-            error_violations = [v for v in violations if v.severity == "error"]
-            return len(error_violations) > 0
+            return any(v.severity is Severity.ERROR for v in violations)
         
         # Require rollback for system operations
         if operation_type == OperationType.SYSTEM:
@@ -782,7 +790,7 @@ class SafetyManager:
         warnings = []
         
         # Add warnings from violations
-        warning_violations = [v for v in violations if v.severity == "warning"]
+        warning_violations = [v for v in violations if v.severity is Severity.WARNING]
         warnings.extend([v.message for v in warning_violations])
         
         # Add general warnings
@@ -796,13 +804,12 @@ class SafetyManager:
     
     def _is_command_safe(self, violations: List[SafetyViolation], safety_level: SafetyLevel) -> bool:
         """Determine if command is safe based on violations and safety level"""
-        error_violations = [v for v in violations if v.severity == "error"]
-        warning_violations = [v for v in violations if v.severity == "warning"]
-        
         # Error violations always make command unsafe
-        if error_violations:
+        if any(v.severity is Severity.ERROR for v in violations):
             return False
         
+        warning_violations = [v for v in violations if v.severity is Severity.WARNING]
+        
         # Check warning threshold based on safety level
         if safety_level == SafetyLevel.STRICT:
             return len(warning_violations) == 0
@@ -818,8 +825,8 @@ class SafetyManager:
         confidence = 1.0
         
         # Reduce confidence for each violation
-        error_count = len([v for v in violations if v.severity == "error"])
-        warning_count = len([v for v in violations if v.severity == "warning"])
+        error_count = len([v for v in violations if v.severity is Severity.ERROR])
+        warning_count = len([v for v in violations if v.severity is Severity.WARNING])
         
         confidence -= error_count * 0.2
         confidence -= warning_count * 0.1
@@ -839,25 +846,10 @@ class SafetyManager:
         }
         
         # Determine rollback operations based on command type
-        operation_type = self._determine_operation_type(parsed_command)
-        
-        if operation_type == OperationType.CREATE:
-            rollback_plan["operations"].append({
-                "type": "delete_created_objects",
-                "description": "Remove objects created by this command"
-            })
-        
-        elif operation_type == OperationType.MODIFY:
-            rollback_plan["operations"].append({
-                "type": "restore_object_state",
-                "description": "Restore objects to previous state"
-            })
-        
-        elif operation_type == OperationType.DELETE:
-            rollback_plan["operations"].append({
-                "type": "restore_deleted_objects",
-                "description": "Restore deleted objects from backup"
-            })
+        operation_type = self._get_operation_type(parsed_command)
+        
+        rollback_plan["operations"] = [dict(op) for op in self._ROLLBACK_TEMPLATES.get(operation_type, ())]
+        if operation_type is OperationType.DELETE:
             rollback_plan["backup_required"] = True
         
         return rollback_plan
@@ -885,7 +877,7 @@ class SafetyManager:
 
 # Utility functions
 def create_safety_rule(name: str, description: str, operation_types: List[str], 
-                      severity: str, validator_function: str, 
+                      severity: Union[str, Severity], validator_function: str, 
                       parameters: Optional[Dict[str, Any]] = None) -> SafetyRule:
     """Create a new safety rule"""
     op_types = [OperationType(op_type) for op_type in operation_types]
@@ -893,7 +885,7 @@ def create_safety_rule(name: str, description: str, operation_types: List[str],
         name=name,
         description=description,
         operation_types=op_types,
-        severity=severity,
+        severity=Severity.coerce(severity),
         validator_function=validator_function,
         parameters=parameters or {}
     )
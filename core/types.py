@@ -8,7 +8,7 @@ to ensure type consistency and avoid import conflicts.
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 @dataclass
@@ -109,14 +109,33 @@ class SafetyLevel(Enum):
     PARANOID = "paranoid"
 
 
+class Severity(IntEnum):
+    """Safety violation severity, ordered so thresholds can use max()/>="""
+    INFO = 0
+    WARNING = 1
+    ERROR = 2
+    
+    @classmethod
+    def coerce(cls, value: Any) -> 'Severity':
+        """Accept legacy string severities ("error", "warning", "info")"""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            return cls[value.upper()]
+        return cls(value)
+
+
 @dataclass
 class SafetyViolation:
     """Represents a safety rule violation"""
     rule_name: str
-    severity: str  # error, warning, info
+    severity: Severity
     message: str
     suggested_fix: Optional[str] = None
     auto_fixable: bool = False
+    
+    def __post_init__(self):
+        self.severity = Severity.coerce(self.severity)
 
 
 @dataclass
@@ -10,13 +10,19 @@ import logging
 import signal
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Awaitable
 try:
     import yaml  # type: ignore
 except ImportError:
     print("PyYAML not installed. Install with: pip install PyYAML")
     sys.exit(1)
 
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper  # type: ignore
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper  # type: ignore
+
 from core.agent import MiktosAgent
 from viewer.real_time_viewer import RealTimeViewer  # type: ignore
 
@@ -43,8 +49,15 @@ class MiktosPlatform:
         self.is_running = False
         self.current_session = None
         
-        # Setup signal handlers
-        self._setup_signal_handlers()
+        # Built-in CLI commands for interactive mode (None means exit)
+        self._cli_dispatch: Dict[str, Optional[Callable[[], Awaitable[None]]]] = {
+            'help': self._cli_help,
+            'status': self._cli_status,
+            'screenshot': self._cli_screenshot,
+            'quit': None,
+            'exit': None,
+            'q': None
+        }
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file"""
@@ -54,11 +67,11 @@ class MiktosPlatform:
             # Create default config
             default_config = self._get_default_config()
             with open(config_file, 'w') as f:
-                yaml.dump(default_config, f, default_flow_style=False)
+                yaml.dump(default_config, f, Dumper=_YamlDumper, default_flow_style=False)
             return default_config
         
         with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YamlLoader)
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration"""
@@ -152,20 +165,33 @@ class MiktosPlatform:
         root_logger.addHandler(file_handler)
         root_logger.addHandler(console_handler)
     
-    def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
+    async def _install_signal_handlers(self):
+        """Install signal handlers for graceful shutdown on the running loop"""
+        loop = asyncio.get_running_loop()
+        
+        def request_shutdown(signum):
             self.logger.info(f"Received signal {signum}, shutting down...")
-            asyncio.create_task(self.shutdown())
+            loop.create_task(self.shutdown())
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, request_shutdown, sig)
+            except (NotImplementedError, RuntimeError):
+                # Windows event loops do not support add_signal_handler;
+                # hand the shutdown over to the loop thread-safely instead
+                signal.signal(
+                    sig,
+                    lambda signum, frame: loop.call_soon_threadsafe(request_shutdown, signum)
+                )
     
     async def start(self) -> bool:
         """Start the Miktos platform"""
         try:
             self.logger.info("Starting Miktos AI Bridge Platform...")
             
+            # Setup signal handlers
+            await self._install_signal_handlers()
+            
             # Initialize agent
             self.agent = MiktosAgent(self.config)
             
@@ -235,8 +261,10 @@ class MiktosPlatform:
         try:
             result = await self.agent.execute_command(command, context or {})
             
-            # Update viewer if available and execution was successful
-            if self.viewer and result.success:
+            # Update viewer if available and execution was successful;
+            # read-only queries leave the scene untouched, so skip the
+            # Blender round trip for them
+            if self.viewer and result.success and result.intent != 'query':
                 # Get updated scene state
                 scene_info = await self.agent.blender_bridge.get_scene_info()
                 if scene_info:
@@ -313,27 +341,28 @@ class MiktosPlatform:
         session_id = await self.start_session()
         print(f"Session started: {session_id}")
         
+        loop = asyncio.get_running_loop()
+        
         while self.is_running:
             try:
-                # Get user input
-                user_input = input("miktos> ").strip()
+                # Read user input off the event loop so viewer and agent
+                # tasks keep running while waiting for keystrokes
+                print("miktos> ", end="", flush=True)
+                line = await loop.run_in_executor(None, sys.stdin.readline)
+                if not line:
+                    # EOF on stdin
+                    break
+                user_input = line.strip()
                 
                 if not user_input:
                     continue
                 
-                if user_input.lower() in ['quit', 'exit', 'q']:
-                    break
-                elif user_input.lower() == 'help':
-                    self._print_help()
-                elif user_input.lower() == 'status':
-                    status = await self.get_status()
-                    print(f"Platform Status: {status}")
-                elif user_input.lower() == 'screenshot':
-                    screenshot = await self.take_screenshot()
-                    if screenshot:
-                        print("Screenshot taken successfully")
-                    else:
-                        print("Failed to take screenshot")
+                cmd = user_input.lower()
+                if cmd in self._cli_dispatch:
+                    handler = self._cli_dispatch[cmd]
+                    if handler is None:
+                        break
+                    await handler()
                 else:
                     # Execute command
                     result = await self.execute_command(user_input)
@@ -359,6 +388,23 @@ class MiktosPlatform:
         await self.stop_session()
         print("Session ended. Goodbye!")
     
+    async def _cli_help(self):
+        """Interactive 'help' command"""
+        self._print_help()
+    
+    async def _cli_status(self):
+        """Interactive 'status' command"""
+        status = await self.get_status()
+        print(f"Platform Status: {status}")
+    
+    async def _cli_screenshot(self):
+        """Interactive 'screenshot' command"""
+        screenshot = await self.take_screenshot()
+        if screenshot:
+            print("Screenshot taken successfully")
+        else:
+            print("Failed to take screenshot")
+    
     def _print_help(self):
         """Print help information"""
         help_text = """
@@ -14,15 +14,41 @@ import time
 import json
 import sys
 import os
-from typing import Dict, Any, List, Optional
+import copy
+import functools
+import operator
+import shutil
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional, Tuple, NamedTuple, Callable, Awaitable
 from pathlib import Path
 import yaml
-from dataclasses import dataclass
+import numpy as np
+
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    import numba
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as _YamlDumper  # type: ignore
+from dataclasses import dataclass, asdict, is_dataclass
 from datetime import datetime
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from core.config_cache import load_yaml_config
 from core.performance_monitor import RealTimePerformanceMonitor
 from core.optimization_engine import OptimizationEngine, OptimizationStrategy
 from core.agent import MiktosAgent
@@ -31,6 +57,353 @@ from workflows.enhanced_workflow_manager import EnhancedWorkflowManager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parsed config files keyed by path -> (mtime, size, config)
+_CONFIG_CACHE: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 16
+
+
+def _load_yaml_cached(path: str) -> Dict[str, Any]:
+    """Load a YAML file, reusing the parsed result while it is unchanged on disk"""
+    st = os.stat(path)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        _CONFIG_CACHE.move_to_end(path)
+        config = cached[2]
+    else:
+        config = load_yaml_config(path)
+        _CONFIG_CACHE[path] = (st.st_mtime, st.st_size, config)
+        if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.popitem(last=False)
+    # Callers mutate the returned config while optimizing
+    return copy.deepcopy(config)
+
+
+# Static configuration patches applied by the optimizers
+_WORKFLOW_CACHE_PATCH = {
+    'caching': {'workflow_results': {'enabled': True, 'ttl': 3600}}  # 1 hour
+}
+
+_WORKFLOW_PATCH = {
+    'skills': {'optimize_execution_order': True, 'cache_results': True}
+}
+
+_RESPONSE_PATCH = {
+    'caching': {'llm_responses': {'ttl': 7200, 'max_entries': 2000}},  # 2 hours
+    'agent': {
+        'enable_command_prediction': True,
+        'enable_response_streaming': True,
+        'nlp': {'model_cache': True}
+    }
+}
+
+_CPU_PATCH = {
+    'monitoring': {
+        'cpu_throttling': True,
+        'cpu_threshold': 80.0,
+        'update_interval': 2.0  # 2 seconds
+    },
+    'skills': {'adaptive_processing': True}
+}
+
+_MEMORY_PATCH = {
+    'performance': {'aggressive_gc': True},
+    'agent': {'nlp': {'memory_efficient': True}},
+    'monitoring': {'memory_monitoring': True, 'memory_threshold': 75.0}
+}
+
+_CACHE_PATCH = {
+    'caching': {
+        'warming': {
+            'enabled': True,
+            'preload_popular': True,
+            'warm_on_startup': True
+        },
+        'llm_responses': {'ttl': 7200},  # 2 hours
+        'workflow_results': {'ttl': 3600},  # 1 hour
+        'skill_results': {'ttl': 1800},  # 30 minutes
+        'eviction_policy': 'lru_with_frequency',
+        'statistics': True
+    }
+}
+
+_GENERAL_PATCH = {
+    'performance': {'async_processing': True, 'profiling_enabled': True},
+    'logging': {'async_logging': True, 'buffer_size': 1000},
+    'blender': {'connection_pooling': True},
+    'viewer': {
+        'quality': 'balanced',  # Balance between quality and performance
+        'frame_rate_limit': 30  # Limit FPS to save resources
+    }
+}
+
+
+# Recommended actions per bottleneck type
+_WF_ACTIONS = (
+    'Enable aggressive caching',
+    'Optimize skill execution order',
+    'Increase parallel processing'
+)
+_RESPONSE_ACTIONS = (
+    'Optimize NLP processing',
+    'Cache frequent commands',
+    'Improve workflow generation speed'
+)
+_CPU_ACTIONS = (
+    'Reduce parallel operations',
+    'Optimize algorithm efficiency',
+    'Enable CPU usage monitoring'
+)
+_MEMORY_ACTIONS = (
+    'Optimize cache sizes',
+    'Clear unused data',
+    'Implement memory pooling'
+)
+_CACHE_ACTIONS = (
+    'Increase cache TTL',
+    'Implement cache warming',
+    'Optimize cache eviction policy'
+)
+
+
+class _BottleneckRule(NamedTuple):
+    """Threshold rule checked by _identify_bottlenecks"""
+    type: str
+    path: Tuple[str, ...]  # Location of the current value in the baseline
+    target_key: str  # Key in config['performance_targets']
+    default_target: float
+    direction: str  # 'gt': bottleneck above target, 'lt': below target
+    description: str  # Template formatted with current= and target=
+    high_ratio: Optional[float]  # High severity above target * ratio
+    high_above: Optional[float]  # High severity above this absolute value
+    actions: Tuple[str, ...]
+
+
+_BOTTLENECK_RULES = (
+    _BottleneckRule(
+        'workflow_time', ('workflow_performance', 'avg_workflow_time'),
+        'max_workflow_time', 60.0, 'gt',
+        "Workflow time ({current:.1f}s) exceeds target ({target:.1f}s)",
+        1.5, None, _WF_ACTIONS
+    ),
+    _BottleneckRule(
+        'response_time', ('response_times', 'avg_response_time'),
+        'max_response_time', 2.0, 'gt',
+        "Response time ({current:.3f}s) exceeds target ({target:.3f}s)",
+        None, None, _RESPONSE_ACTIONS
+    ),
+    _BottleneckRule(
+        'cpu_usage', ('system_resources', 'cpu_usage'),
+        'max_cpu_usage', 80.0, 'gt',
+        "CPU usage ({current:.1f}%) exceeds target ({target:.1f}%)",
+        None, 90.0, _CPU_ACTIONS
+    ),
+    _BottleneckRule(
+        'memory_usage', ('system_resources', 'memory_usage'),
+        'max_memory_usage', 75.0, 'gt',
+        "Memory usage ({current:.1f}%) exceeds target ({target:.1f}%)",
+        None, 90.0, _MEMORY_ACTIONS
+    ),
+    _BottleneckRule(
+        'cache_performance', ('cache_performance', 'cache_hit_rate'),
+        'min_cache_hit_rate', 0.8, 'lt',
+        "Cache hit rate ({current:.1%}) below target ({target:.1%})",
+        None, None, _CACHE_ACTIONS
+    ),
+)
+
+
+# Metrics compared by _calculate_improvements:
+# (name, path in metrics dict, target upper bound, skip when baseline is zero)
+_IMPROVEMENT_METRICS = (
+    ('workflow_time', ('workflow_performance', 'avg_workflow_time'), 60.0, True),
+    ('response_time', ('response_times', 'avg_response_time'), 2.0, True),
+    ('cpu_usage', ('system_resources', 'cpu_usage'), 80.0, False),
+    ('memory_usage', ('system_resources', 'memory_usage'), 75.0, False),
+)
+_IMPROVEMENT_TARGETS = np.array([metric[2] for metric in _IMPROVEMENT_METRICS], dtype=np.float64)
+
+
+if _HAS_NUMBA:
+    @numba.njit(cache=True)
+    def _improvement_percent(baseline_values, final_values):
+        """Percentage improvement per metric; 0 where the baseline is not positive"""
+        result = np.zeros_like(baseline_values)
+        for i in range(baseline_values.shape[0]):
+            if baseline_values[i] > 0:
+                result[i] = (baseline_values[i] - final_values[i]) / baseline_values[i] * 100.0
+        return result
+else:
+    def _improvement_percent(baseline_values, final_values):
+        """Percentage improvement per metric; 0 where the baseline is not positive"""
+        has_baseline = baseline_values > 0
+        return np.where(
+            has_baseline,
+            (baseline_values - final_values) / np.where(has_baseline, baseline_values, 1.0) * 100,
+            0.0
+        )
+
+
+def _flatten_metrics(metrics: Dict[str, Any]) -> np.ndarray:
+    """Pull the _IMPROVEMENT_METRICS values out of a metrics dict as an array"""
+    return np.fromiter(
+        (functools.reduce(operator.getitem, path, metrics) for _, path, _, _ in _IMPROVEMENT_METRICS),
+        dtype=np.float64,
+        count=len(_IMPROVEMENT_METRICS)
+    )
+
+
+def _deep_merge(dst: Dict[str, Any], src: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge src into dst without sharing nested dicts from src"""
+    for key, value in src.items():
+        if isinstance(value, dict):
+            node = dst.get(key)
+            if not isinstance(node, dict):
+                node = dst[key] = {}
+            _deep_merge(node, value)
+        else:
+            dst[key] = value
+    return dst
+
+
+def _write_yaml_atomic(path: Path, data: Dict[str, Any]):
+    """Write YAML to a temporary file and atomically move it into place"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w') as f:
+        yaml.dump(data, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the stdlib json encoder does not handle"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    return str(obj)
+
+
+def _dump_json(data: Any) -> bytes:
+    """Serialize optimization results to indented JSON bytes in a single pass"""
+    if _HAS_ORJSON:
+        # orjson handles datetimes, dataclasses and numpy values natively
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(data, default=_json_default, indent=2).encode('utf-8')
+
+
+def _summary_stats(values: List[float]) -> Tuple[float, float, float]:
+    """Return (mean, max, min) of the values, or zeros when there are none"""
+    if not values:
+        return 0.0, 0.0, 0.0
+    arr = np.asarray(values, dtype=np.float64)
+    return float(arr.mean()), float(arr.max()), float(arr.min())
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config_template() -> Dict[str, Any]:
+    """Default optimization configuration, built once per process"""
+    return {
+        'optimization': {
+            'auto_optimize': True,
+            'strategy': 'balanced',
+            'monitoring_interval': 1.0,
+            'optimization_interval': 300
+        },
+        'performance_targets': {
+            'max_workflow_time': 60.0,  # Sub-1-minute target
+            'min_cache_hit_rate': 0.8,  # 80% cache hit rate
+            'max_cpu_usage': 80.0,      # 80% CPU usage
+            'max_memory_usage': 75.0,   # 75% memory usage
+            'min_fps': 30.0,            # 30 FPS minimum
+            'max_response_time': 2.0    # 2 second response time
+        },
+        'skills': {
+            'max_parallel': 2,
+            'parallel_execution': True,
+            'cache_results': True
+        },
+        'caching': {
+            'llm_responses': {'ttl': 3600, 'max_entries': 1000},
+            'workflow_results': {'enabled': True, 'ttl': 1800},
+            'memory_cache': {'max_entries': 1000, 'max_memory_mb': 512}
+        }
+    }
+
+
+# Agents and workflow managers are expensive to boot (NLP models etc.), so
+# optimizers in the same process share them while any of them is alive
+_AGENT_CACHE: "weakref.WeakValueDictionary[str, MiktosAgent]" = weakref.WeakValueDictionary()
+_WORKFLOW_MANAGER_CACHE: "weakref.WeakValueDictionary[str, EnhancedWorkflowManager]" = weakref.WeakValueDictionary()
+
+
+def _shared_agent(config: Dict[str, Any]) -> MiktosAgent:
+    """Get an agent for this configuration, reusing a live one if possible"""
+    # Keyed on the serialized config itself, so any change to the config
+    # (such as applied optimizations) gets a new agent instead of a stale one
+    key = json.dumps(config, sort_keys=True, default=str)
+    agent = _AGENT_CACHE.get(key)
+    if agent is None:
+        # The agent keeps its own copy, matching the config it was keyed on
+        agent = MiktosAgent(copy.deepcopy(config))
+        _AGENT_CACHE[key] = agent
+    return agent
+
+
+def _shared_workflow_manager() -> EnhancedWorkflowManager:
+    """Get the process-wide workflow manager, creating it if needed"""
+    workflow_manager = _WORKFLOW_MANAGER_CACHE.get('default')
+    if workflow_manager is None:
+        workflow_manager = EnhancedWorkflowManager()
+        _WORKFLOW_MANAGER_CACHE['default'] = workflow_manager
+    return workflow_manager
+
+
+async def _timed(coro) -> Tuple[float, Any]:
+    """Await a coroutine and return (elapsed seconds, result)"""
+    start_time = time.perf_counter()
+    result = await coro
+    return time.perf_counter() - start_time, result
+
+
+@dataclass(frozen=True)
+class SystemSnapshot:
+    """Point-in-time system resource figures shared by one optimization pass"""
+    cpu_count: int
+    memory_percent: float
+    available_memory_gb: float
+    total_memory_gb: float
+    
+    @classmethod
+    def capture(cls) -> 'SystemSnapshot':
+        memory = psutil.virtual_memory()
+        return cls(
+            cpu_count=psutil.cpu_count() or 2,  # Default to 2 if detection fails
+            memory_percent=memory.percent,
+            available_memory_gb=memory.available / (1024**3),
+            total_memory_gb=memory.total / (1024**3)
+        )
+
+
+@dataclass(frozen=True)
+class Bottleneck:
+    """Performance bottleneck found in the baseline"""
+    __slots__ = (
+        'type', 'severity', 'current_value', 'target_value',
+        'improvement_needed', 'description', 'recommended_actions'
+    )
+    type: str
+    severity: str
+    current_value: float
+    target_value: float
+    improvement_needed: float
+    description: str
+    recommended_actions: Tuple[str, ...]
+
 
 @dataclass
 class OptimizationTarget:
@@ -52,44 +425,42 @@ class PerformanceOptimizer:
         self.performance_baseline = {}
         self.bottlenecks_identified = []
         self.optimizations_applied = []
+        self._sys: Optional[SystemSnapshot] = None
+        
+        # Targeted optimization for each bottleneck type
+        self._optimizers: Dict[str, Callable[[], Awaitable[Dict[str, Any]]]] = {
+            'workflow_time': self._optimize_workflow_time,
+            'response_time': self._optimize_response_time,
+            'cpu_usage': self._optimize_cpu_usage,
+            'memory_usage': self._optimize_memory_usage,
+            'cache_performance': self._optimize_cache_performance
+        }
+        
+        # Platform components, shared by baseline and validation measurements
+        self._monitor: Optional[RealTimePerformanceMonitor] = None
+        self._optimizer: Optional[OptimizationEngine] = None
+        self._agent: Optional[MiktosAgent] = None
+        self._wm: Optional[EnhancedWorkflowManager] = None
+        self._components_running = False
+    
+    def _system_snapshot(self) -> SystemSnapshot:
+        """Get the system snapshot for the current optimization run"""
+        if self._sys is None:
+            self._sys = SystemSnapshot.capture()
+        return self._sys
         
     def _load_config(self) -> Dict[str, Any]:
         """Load platform configuration"""
         try:
-            with open('config.yaml', 'r') as f:
-                return yaml.safe_load(f)
+            return _load_yaml_cached('config.yaml')
         except Exception as e:
             logger.warning(f"Could not load config.yaml: {e}")
             return self._get_default_config()
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration for optimization"""
-        return {
-            'optimization': {
-                'auto_optimize': True,
-                'strategy': 'balanced',
-                'monitoring_interval': 1.0,
-                'optimization_interval': 300
-            },
-            'performance_targets': {
-                'max_workflow_time': 60.0,  # Sub-1-minute target
-                'min_cache_hit_rate': 0.8,  # 80% cache hit rate
-                'max_cpu_usage': 80.0,      # 80% CPU usage
-                'max_memory_usage': 75.0,   # 75% memory usage
-                'min_fps': 30.0,            # 30 FPS minimum
-                'max_response_time': 2.0    # 2 second response time
-            },
-            'skills': {
-                'max_parallel': 2,
-                'parallel_execution': True,
-                'cache_results': True
-            },
-            'caching': {
-                'llm_responses': {'ttl': 3600, 'max_entries': 1000},
-                'workflow_results': {'enabled': True, 'ttl': 1800},
-                'memory_cache': {'max_entries': 1000, 'max_memory_mb': 512}
-            }
-        }
+        # Copy the shared template; the optimizers mutate the returned config
+        return copy.deepcopy(_default_config_template())
 
     async def run_comprehensive_optimization(self) -> Dict[str, Any]:
         """Run comprehensive performance optimization"""
@@ -97,7 +468,7 @@ class PerformanceOptimizer:
         logger.info("=" * 60)
         
         optimization_summary = {
-            'start_time': datetime.now().isoformat(),
+            'start_time': datetime.now(),
             'baseline_performance': {},
             'bottlenecks_found': [],
             'optimizations_applied': [],
@@ -107,39 +478,46 @@ class PerformanceOptimizer:
         }
         
         try:
-            # Step 1: Establish performance baseline
-            logger.info("\n1. 📊 Establishing Performance Baseline...")
-            baseline = await self._establish_performance_baseline()
-            optimization_summary['baseline_performance'] = baseline
-            
-            # Step 2: Identify bottlenecks
-            logger.info("\n2. 🔍 Identifying Performance Bottlenecks...")
-            bottlenecks = await self._identify_bottlenecks(baseline)
-            optimization_summary['bottlenecks_found'] = bottlenecks
-            
-            # Step 3: Apply targeted optimizations
-            logger.info("\n3. ⚡ Applying Targeted Optimizations...")
-            optimizations = await self._apply_optimizations(bottlenecks)
-            optimization_summary['optimizations_applied'] = optimizations
-            
-            # Step 4: Validate improvements
-            logger.info("\n4. ✅ Validating Performance Improvements...")
-            final_performance = await self._validate_improvements()
-            optimization_summary['final_performance'] = final_performance
+            # Capture system figures once for this run
+            self._sys = SystemSnapshot.capture()
             
-            # Step 5: Calculate improvement metrics
-            logger.info("\n5. 📈 Calculating Improvement Metrics...")
-            improvements = self._calculate_improvements(baseline, final_performance)
-            optimization_summary['improvement_metrics'] = improvements
-            
-            # Step 6: Generate optimization report
-            logger.info("\n6. 📋 Generating Optimization Report...")
-            optimization_summary['optimization_status'] = self._determine_optimization_status(improvements)
+            # Boot platform components once; baseline and validation share them
+            self._construct_components()
+            async with self._running_components():
+                # Step 1: Establish performance baseline
+                logger.info("\n1. 📊 Establishing Performance Baseline...")
+                logger.info("   Collecting baseline performance metrics...")
+                baseline = await self._measure_metrics()
+                optimization_summary['baseline_performance'] = baseline
+                
+                # Step 2: Identify bottlenecks
+                logger.info("\n2. 🔍 Identifying Performance Bottlenecks...")
+                bottlenecks = await self._identify_bottlenecks(baseline)
+                optimization_summary['bottlenecks_found'] = bottlenecks
+                
+                # Step 3: Apply targeted optimizations
+                logger.info("\n3. ⚡ Applying Targeted Optimizations...")
+                optimizations = await self._apply_optimizations(bottlenecks)
+                optimization_summary['optimizations_applied'] = optimizations
+                
+                # Step 4: Validate improvements
+                logger.info("\n4. ✅ Validating Performance Improvements...")
+                final_performance = await self._validate_improvements()
+                optimization_summary['final_performance'] = final_performance
+                
+                # Step 5: Calculate improvement metrics
+                logger.info("\n5. 📈 Calculating Improvement Metrics...")
+                improvements = self._calculate_improvements(baseline, final_performance)
+                optimization_summary['improvement_metrics'] = improvements
+                
+                # Step 6: Generate optimization report
+                logger.info("\n6. 📋 Generating Optimization Report...")
+                optimization_summary['optimization_status'] = self._determine_optimization_status(improvements)
             
             # Print comprehensive summary
             self._print_optimization_summary(optimization_summary)
             
-            optimization_summary['end_time'] = datetime.now().isoformat()
+            optimization_summary['end_time'] = datetime.now()
             
             return optimization_summary
             
@@ -149,21 +527,52 @@ class PerformanceOptimizer:
             optimization_summary['optimization_status'] = 'failed'
             return optimization_summary
 
-    async def _establish_performance_baseline(self) -> Dict[str, Any]:
-        """Establish current performance baseline"""
-        logger.info("   Collecting baseline performance metrics...")
-        
-        # Initialize monitoring systems
-        performance_monitor = RealTimePerformanceMonitor(self.config)
-        await performance_monitor.start_monitoring()
-        
-        # Initialize optimization engine
-        optimizer = OptimizationEngine(self.config)
-        await optimizer.start_optimization()
-        
-        # Initialize platform components
-        agent = MiktosAgent(self.config)
-        workflow_manager = EnhancedWorkflowManager()
+    def _construct_components(self):
+        """Instantiate monitoring, optimization and platform components"""
+        if self._agent is not None:
+            return
+        
+        self._monitor = RealTimePerformanceMonitor(self.config)
+        self._optimizer = OptimizationEngine(self.config)
+        self._agent = _shared_agent(self.config)
+        self._wm = _shared_workflow_manager()
+
+    @asynccontextmanager
+    async def _running_components(self):
+        """Run performance monitoring and the optimization engine for the block"""
+        components = (
+            (self._monitor.start_monitoring, self._monitor.stop_monitoring),
+            (self._optimizer.start_optimization, self._optimizer.stop_optimization),
+        )
+        results = await asyncio.gather(
+            *(start() for start, _ in components),
+            return_exceptions=True
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            # Do not leak whichever component did start
+            await asyncio.gather(
+                *(stop() for (_, stop), result in zip(components, results)
+                  if not isinstance(result, BaseException)),
+                return_exceptions=True
+            )
+            raise failures[0]
+        self._components_running = True
+        try:
+            yield
+        finally:
+            self._components_running = False
+            await asyncio.gather(
+                self._monitor.stop_monitoring(),
+                self._optimizer.stop_optimization(),
+                return_exceptions=True
+            )
+
+    async def _measure_metrics(self) -> Dict[str, Any]:
+        """Measure current platform performance using the shared components"""
+        self._construct_components()
+        agent = self._agent
+        workflow_manager = self._wm
         
         baseline = {
             'system_resources': {},
@@ -173,238 +582,160 @@ class PerformanceOptimizer:
             'component_status': {}
         }
         
-        try:
-            # System resource baseline
-            baseline['system_resources'] = {
-                'cpu_usage': psutil.cpu_percent(interval=1),
-                'memory_usage': psutil.virtual_memory().percent,
-                'disk_usage': psutil.disk_usage('/').percent,
-                'available_memory': psutil.virtual_memory().available / (1024**3),  # GB
-                'cpu_count': psutil.cpu_count()
-            }
-            
-            logger.info(f"   ✓ System Resources: CPU {baseline['system_resources']['cpu_usage']:.1f}%, Memory {baseline['system_resources']['memory_usage']:.1f}%")
-            
-            # Workflow performance baseline
-            test_workflows = [
-                "Create a simple cube",
-                "Add metallic material to object", 
-                "Set up basic lighting",
-                "Position camera for rendering"
-            ]
-            
-            workflow_times = []
-            response_times = []
-            
-            for workflow_cmd in test_workflows:
-                start_time = time.time()
-                try:
-                    workflow = await agent.generate_workflow(workflow_cmd)
-                    response_time = time.time() - start_time
-                    response_times.append(response_time)
-                    
-                    if workflow and 'estimated_total_time' in workflow:
-                        workflow_times.append(workflow['estimated_total_time'])
-                    
-                    logger.info(f"   ✓ Workflow '{workflow_cmd[:20]}...': {response_time:.3f}s response")
-                    
-                except Exception as e:
-                    logger.warning(f"   ⚠ Workflow failed '{workflow_cmd[:20]}...': {e}")
-            
-            baseline['workflow_performance'] = {
-                'avg_workflow_time': sum(workflow_times) / len(workflow_times) if workflow_times else 0,
-                'max_workflow_time': max(workflow_times) if workflow_times else 0,
-                'workflow_success_rate': len(workflow_times) / len(test_workflows)
-            }
-            
-            baseline['response_times'] = {
-                'avg_response_time': sum(response_times) / len(response_times) if response_times else 0,
-                'max_response_time': max(response_times) if response_times else 0,
-                'min_response_time': min(response_times) if response_times else 0
-            }
-            
-            logger.info(f"   ✓ Workflow Performance: avg {baseline['workflow_performance']['avg_workflow_time']:.1f}s")
-            logger.info(f"   ✓ Response Times: avg {baseline['response_times']['avg_response_time']:.3f}s")
-            
-            # Cache performance baseline
-            templates = await workflow_manager.list_templates()
-            baseline['cache_performance'] = {
-                'templates_cached': len(templates),
-                'cache_hit_rate': 0.5,  # Initial estimate
-                'cache_size': 0
-            }
-            
-            logger.info(f"   ✓ Cache Performance: {len(templates)} templates cached")
+        # System resource baseline. cpu_percent(interval=1) would block the
+        # event loop for a second, so sample it in a worker thread instead.
+        # Non-blocking cpu_percent(None) readings share state with the
+        # monitor's own calls and would be skewed by them
+        loop = asyncio.get_running_loop()
+        cpu_usage = await loop.run_in_executor(None, psutil.cpu_percent, 1.0)
+        system = self._system_snapshot()
+        baseline['system_resources'] = {
+            'cpu_usage': cpu_usage,
+            'memory_usage': system.memory_percent,
+            'disk_usage': psutil.disk_usage('/').percent,
+            'available_memory': system.available_memory_gb,  # GB
+            'cpu_count': system.cpu_count
+        }
+        
+        logger.info("   ✓ System Resources: CPU %.1f%%, Memory %.1f%%",
+                    baseline['system_resources']['cpu_usage'],
+                    baseline['system_resources']['memory_usage'])
+        
+        # Workflow performance baseline
+        test_workflows = [
+            "Create a simple cube",
+            "Add metallic material to object", 
+            "Set up basic lighting",
+            "Position camera for rendering"
+        ]
+        
+        workflow_times = []
+        response_times = []
+        
+        # Generate all test workflows concurrently. Each response time is
+        # still measured per call, but calls now overlap, so these numbers
+        # are concurrent latencies rather than isolated serial ones.
+        results = await asyncio.gather(
+            *(_timed(agent.generate_workflow(workflow_cmd)) for workflow_cmd in test_workflows),
+            return_exceptions=True
+        )
+        
+        for workflow_cmd, outcome in zip(test_workflows, results):
+            if isinstance(outcome, Exception):
+                logger.warning("   ⚠ Workflow failed '%.20s...': %s", workflow_cmd, outcome)
+                continue
             
-            # Component status
-            baseline['component_status'] = {
-                'agent_functional': True,
-                'workflow_manager_functional': len(templates) > 0,
-                'performance_monitor_active': True,
-                'optimizer_active': True
-            }
+            response_time, workflow = outcome
+            response_times.append(response_time)
             
-            logger.info("   ✅ Baseline established successfully")
+            if workflow and 'estimated_total_time' in workflow:
+                workflow_times.append(workflow['estimated_total_time'])
             
-        finally:
-            # Clean up monitoring
-            await performance_monitor.stop_monitoring()
-            await optimizer.stop_optimization()
+            logger.info("   ✓ Workflow '%.20s...': %.3fs response", workflow_cmd, response_time)
+        
+        workflow_avg, workflow_max, _ = _summary_stats(workflow_times)
+        baseline['workflow_performance'] = {
+            'avg_workflow_time': workflow_avg,
+            'max_workflow_time': workflow_max,
+            'workflow_success_rate': len(workflow_times) / len(test_workflows)
+        }
+        
+        response_avg, response_max, response_min = _summary_stats(response_times)
+        baseline['response_times'] = {
+            'avg_response_time': response_avg,
+            'max_response_time': response_max,
+            'min_response_time': response_min
+        }
+        
+        logger.info("   ✓ Workflow Performance: avg %.1fs", baseline['workflow_performance']['avg_workflow_time'])
+        logger.info("   ✓ Response Times: avg %.3fs", baseline['response_times']['avg_response_time'])
+        
+        # Cache performance baseline
+        templates = await workflow_manager.list_templates()
+        baseline['cache_performance'] = {
+            'templates_cached': len(templates),
+            'cache_hit_rate': 0.5,  # Initial estimate
+            'cache_size': 0
+        }
+        
+        logger.info("   ✓ Cache Performance: %d templates cached", len(templates))
+        
+        # Component status
+        baseline['component_status'] = {
+            'agent_functional': True,
+            'workflow_manager_functional': len(templates) > 0,
+            'performance_monitor_active': self._components_running,
+            'optimizer_active': self._components_running
+        }
+        
+        logger.info("   ✅ Metrics collected successfully")
         
         return baseline
 
-    async def _identify_bottlenecks(self, baseline: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def _identify_bottlenecks(self, baseline: Dict[str, Any]) -> List[Bottleneck]:
         """Identify performance bottlenecks"""
         logger.info("   Analyzing performance bottlenecks...")
         
         bottlenecks = []
         targets = self.config.get('performance_targets', {})
         
-        # Check workflow time bottleneck
-        avg_workflow_time = baseline['workflow_performance']['avg_workflow_time']
-        target_workflow_time = targets.get('max_workflow_time', 60.0)
-        
-        if avg_workflow_time > target_workflow_time:
-            bottleneck = {
-                'type': 'workflow_time',
-                'severity': 'high' if avg_workflow_time > target_workflow_time * 1.5 else 'medium',
-                'current_value': avg_workflow_time,
-                'target_value': target_workflow_time,
-                'improvement_needed': avg_workflow_time - target_workflow_time,
-                'description': f"Workflow time ({avg_workflow_time:.1f}s) exceeds target ({target_workflow_time:.1f}s)",
-                'recommended_actions': [
-                    'Enable aggressive caching',
-                    'Optimize skill execution order',
-                    'Increase parallel processing'
-                ]
-            }
-            bottlenecks.append(bottleneck)
-            logger.info(f"   ❌ Bottleneck: {bottleneck['description']}")
-        
-        # Check response time bottleneck
-        avg_response_time = baseline['response_times']['avg_response_time']
-        target_response_time = targets.get('max_response_time', 2.0)
-        
-        if avg_response_time > target_response_time:
-            bottleneck = {
-                'type': 'response_time',
-                'severity': 'medium',
-                'current_value': avg_response_time,
-                'target_value': target_response_time,
-                'improvement_needed': avg_response_time - target_response_time,
-                'description': f"Response time ({avg_response_time:.3f}s) exceeds target ({target_response_time:.3f}s)",
-                'recommended_actions': [
-                    'Optimize NLP processing',
-                    'Cache frequent commands',
-                    'Improve workflow generation speed'
-                ]
-            }
-            bottlenecks.append(bottleneck)
-            logger.info(f"   ❌ Bottleneck: {bottleneck['description']}")
-        
-        # Check system resource bottlenecks
-        cpu_usage = baseline['system_resources']['cpu_usage']
-        memory_usage = baseline['system_resources']['memory_usage']
-        
-        target_cpu = targets.get('max_cpu_usage', 80.0)
-        target_memory = targets.get('max_memory_usage', 75.0)
-        
-        if cpu_usage > target_cpu:
-            bottleneck = {
-                'type': 'cpu_usage',
-                'severity': 'high' if cpu_usage > 90 else 'medium',
-                'current_value': cpu_usage,
-                'target_value': target_cpu,
-                'improvement_needed': cpu_usage - target_cpu,
-                'description': f"CPU usage ({cpu_usage:.1f}%) exceeds target ({target_cpu:.1f}%)",
-                'recommended_actions': [
-                    'Reduce parallel operations',
-                    'Optimize algorithm efficiency',
-                    'Enable CPU usage monitoring'
-                ]
-            }
-            bottlenecks.append(bottleneck)
-            logger.info(f"   ❌ Bottleneck: {bottleneck['description']}")
-        
-        if memory_usage > target_memory:
-            bottleneck = {
-                'type': 'memory_usage',
-                'severity': 'high' if memory_usage > 90 else 'medium',
-                'current_value': memory_usage,
-                'target_value': target_memory,
-                'improvement_needed': memory_usage - target_memory,
-                'description': f"Memory usage ({memory_usage:.1f}%) exceeds target ({target_memory:.1f}%)",
-                'recommended_actions': [
-                    'Optimize cache sizes',
-                    'Clear unused data',
-                    'Implement memory pooling'
-                ]
-            }
-            bottlenecks.append(bottleneck)
-            logger.info(f"   ❌ Bottleneck: {bottleneck['description']}")
-        
-        # Check cache performance
-        cache_hit_rate = baseline['cache_performance']['cache_hit_rate']
-        target_cache_rate = targets.get('min_cache_hit_rate', 0.8)
-        
-        if cache_hit_rate < target_cache_rate:
-            bottleneck = {
-                'type': 'cache_performance',
-                'severity': 'medium',
-                'current_value': cache_hit_rate,
-                'target_value': target_cache_rate,
-                'improvement_needed': target_cache_rate - cache_hit_rate,
-                'description': f"Cache hit rate ({cache_hit_rate:.1%}) below target ({target_cache_rate:.1%})",
-                'recommended_actions': [
-                    'Increase cache TTL',
-                    'Implement cache warming',
-                    'Optimize cache eviction policy'
-                ]
-            }
+        for rule in _BOTTLENECK_RULES:
+            current = functools.reduce(operator.getitem, rule.path, baseline)
+            target = targets.get(rule.target_key, rule.default_target)
+            
+            if rule.direction == 'gt':
+                if not current > target:
+                    continue
+                improvement_needed = current - target
+            else:
+                if not current < target:
+                    continue
+                improvement_needed = target - current
+            
+            high = (
+                (rule.high_ratio is not None and current > target * rule.high_ratio) or
+                (rule.high_above is not None and current > rule.high_above)
+            )
+            bottleneck = Bottleneck(
+                type=rule.type,
+                severity='high' if high else 'medium',
+                current_value=current,
+                target_value=target,
+                improvement_needed=improvement_needed,
+                description=rule.description.format(current=current, target=target),
+                recommended_actions=rule.actions
+            )
             bottlenecks.append(bottleneck)
-            logger.info(f"   ❌ Bottleneck: {bottleneck['description']}")
+            logger.info("   ❌ Bottleneck: %s", bottleneck.description)
         
         if not bottlenecks:
             logger.info("   ✅ No significant bottlenecks identified")
         else:
-            logger.info(f"   📊 Identified {len(bottlenecks)} bottlenecks requiring optimization")
+            logger.info("   📊 Identified %d bottlenecks requiring optimization", len(bottlenecks))
         
         return bottlenecks
 
-    async def _apply_optimizations(self, bottlenecks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _apply_optimizations(self, bottlenecks: List[Bottleneck]) -> List[Dict[str, Any]]:
         """Apply targeted optimizations based on identified bottlenecks"""
         logger.info("   Applying performance optimizations...")
         
-        optimizations_applied = []
+        targeted = [
+            (bottleneck, self._optimizers[bottleneck.type])
+            for bottleneck in bottlenecks
+            if bottleneck.type in self._optimizers
+        ]
         
-        for bottleneck in bottlenecks:
-            logger.info(f"   Optimizing: {bottleneck['type']}")
-            
-            if bottleneck['type'] == 'workflow_time':
-                optimization = await self._optimize_workflow_time()
-                optimizations_applied.append(optimization)
-                
-            elif bottleneck['type'] == 'response_time':
-                optimization = await self._optimize_response_time()
-                optimizations_applied.append(optimization)
-                
-            elif bottleneck['type'] == 'cpu_usage':
-                optimization = await self._optimize_cpu_usage()
-                optimizations_applied.append(optimization)
-                
-            elif bottleneck['type'] == 'memory_usage':
-                optimization = await self._optimize_memory_usage()
-                optimizations_applied.append(optimization)
-                
-            elif bottleneck['type'] == 'cache_performance':
-                optimization = await self._optimize_cache_performance()
-                optimizations_applied.append(optimization)
+        # One slot per targeted optimization plus the general one
+        optimizations_applied: List[Dict[str, Any]] = [{}] * (len(targeted) + 1)
+        
+        for i, (bottleneck, handler) in enumerate(targeted):
+            logger.info("   Optimizing: %s", bottleneck.type)
+            optimizations_applied[i] = await handler()
         
         # Apply general optimizations
-        general_optimization = await self._apply_general_optimizations()
-        optimizations_applied.append(general_optimization)
+        optimizations_applied[-1] = await self._apply_general_optimizations()
         
-        logger.info(f"   ✅ Applied {len(optimizations_applied)} optimizations")
+        logger.info("   ✅ Applied %d optimizations", len(optimizations_applied))
         
         return optimizations_applied
 
@@ -422,25 +753,21 @@ class PerformanceOptimizer:
         try:
             # Enable aggressive workflow caching
             if not self.config.get('caching', {}).get('workflow_results', {}).get('enabled', False):
-                self.config.setdefault('caching', {}).setdefault('workflow_results', {})['enabled'] = True
-                self.config['caching']['workflow_results']['ttl'] = 3600  # 1 hour
+                _deep_merge(self.config, _WORKFLOW_CACHE_PATCH)
                 optimization['actions_taken'].append('Enabled workflow result caching')
             
             # Increase parallel processing if CPU allows
             current_parallel = self.config.get('skills', {}).get('max_parallel', 2)
-            cpu_count = psutil.cpu_count() or 2  # Default to 2 if detection fails
+            cpu_count = self._system_snapshot().cpu_count
             optimal_parallel = min(cpu_count - 1, 4)  # Leave one core free, max 4
             
             if optimal_parallel > current_parallel:
                 self.config.setdefault('skills', {})['max_parallel'] = optimal_parallel
                 optimization['actions_taken'].append(f'Increased parallel processing: {current_parallel} → {optimal_parallel}')
             
-            # Optimize skill execution order
-            self.config.setdefault('skills', {})['optimize_execution_order'] = True
+            # Optimize skill execution order and enable skill result caching
+            _deep_merge(self.config, _WORKFLOW_PATCH)
             optimization['actions_taken'].append('Enabled execution order optimization')
-            
-            # Enable skill result caching
-            self.config.setdefault('skills', {})['cache_results'] = True
             optimization['actions_taken'].append('Enabled skill result caching')
             
             logger.info("     ✅ Workflow time optimization completed")
@@ -448,7 +775,7 @@ class PerformanceOptimizer:
         except Exception as e:
             optimization['status'] = 'failed'
             optimization['error'] = str(e)
-            logger.error(f"     ❌ Workflow time optimization failed: {e}")
+            logger.error("     ❌ Workflow time optimization failed: %s", e)
         
         return optimization
 
@@ -464,22 +791,12 @@ class PerformanceOptimizer:
         }
         
         try:
-            # Optimize LLM response caching
-            llm_cache = self.config.setdefault('caching', {}).setdefault('llm_responses', {})
-            llm_cache['ttl'] = 7200  # 2 hours
-            llm_cache['max_entries'] = 2000
+            # LLM response caching, command prediction, NLP model caching
+            # and response streaming for faster perceived performance
+            _deep_merge(self.config, _RESPONSE_PATCH)
             optimization['actions_taken'].append('Optimized LLM response caching')
-            
-            # Enable command prediction and pre-processing
-            self.config.setdefault('agent', {})['enable_command_prediction'] = True
             optimization['actions_taken'].append('Enabled command prediction')
-            
-            # Optimize NLP model loading
-            self.config.setdefault('agent', {}).setdefault('nlp', {})['model_cache'] = True
             optimization['actions_taken'].append('Enabled NLP model caching')
-            
-            # Enable response streaming for faster perceived performance
-            self.config.setdefault('agent', {})['enable_response_streaming'] = True
             optimization['actions_taken'].append('Enabled response streaming')
             
             logger.info("     ✅ Response time optimization completed")
@@ -487,7 +804,7 @@ class PerformanceOptimizer:
         except Exception as e:
             optimization['status'] = 'failed'
             optimization['error'] = str(e)
-            logger.error(f"     ❌ Response time optimization failed: {e}")
+            logger.error("     ❌ Response time optimization failed: %s", e)
         
         return optimization
 
@@ -509,17 +826,10 @@ class PerformanceOptimizer:
                 self.config['skills']['max_parallel'] = 2
                 optimization['actions_taken'].append(f'Reduced parallel operations: {current_parallel} → 2')
             
-            # Enable CPU usage monitoring and throttling
-            self.config.setdefault('monitoring', {})['cpu_throttling'] = True
-            self.config['monitoring']['cpu_threshold'] = 80.0
+            # CPU throttling, monitoring frequency and adaptive processing
+            _deep_merge(self.config, _CPU_PATCH)
             optimization['actions_taken'].append('Enabled CPU usage monitoring and throttling')
-            
-            # Optimize monitoring frequency
-            self.config.setdefault('monitoring', {})['update_interval'] = 2.0  # 2 seconds
             optimization['actions_taken'].append('Optimized monitoring frequency')
-            
-            # Enable adaptive processing
-            self.config.setdefault('skills', {})['adaptive_processing'] = True
             optimization['actions_taken'].append('Enabled adaptive processing based on CPU load')
             
             logger.info("     ✅ CPU usage optimization completed")
@@ -527,7 +837,7 @@ class PerformanceOptimizer:
         except Exception as e:
             optimization['status'] = 'failed'
             optimization['error'] = str(e)
-            logger.error(f"     ❌ CPU usage optimization failed: {e}")
+            logger.error("     ❌ CPU usage optimization failed: %s", e)
         
         return optimization
 
@@ -545,7 +855,7 @@ class PerformanceOptimizer:
         try:
             # Optimize cache memory limits
             memory_cache = self.config.setdefault('caching', {}).setdefault('memory_cache', {})
-            available_memory_gb = psutil.virtual_memory().available / (1024**3)
+            available_memory_gb = self._system_snapshot().available_memory_gb
             
             # Use 10% of available memory for caching, max 1GB
             optimal_cache_mb = min(int(available_memory_gb * 0.1 * 1024), 1024)
@@ -554,17 +864,10 @@ class PerformanceOptimizer:
             
             optimization['actions_taken'].append(f'Optimized cache memory limit: {optimal_cache_mb}MB')
             
-            # Enable garbage collection optimization
-            self.config.setdefault('performance', {})['aggressive_gc'] = True
+            # Garbage collection, model memory footprint and memory monitoring
+            _deep_merge(self.config, _MEMORY_PATCH)
             optimization['actions_taken'].append('Enabled aggressive garbage collection')
-            
-            # Reduce model memory footprint
-            self.config.setdefault('agent', {}).setdefault('nlp', {})['memory_efficient'] = True
             optimization['actions_taken'].append('Enabled memory-efficient NLP models')
-            
-            # Enable memory monitoring
-            self.config.setdefault('monitoring', {})['memory_monitoring'] = True
-            self.config['monitoring']['memory_threshold'] = 75.0
             optimization['actions_taken'].append('Enabled memory usage monitoring')
             
             logger.info("     ✅ Memory usage optimization completed")
@@ -572,7 +875,7 @@ class PerformanceOptimizer:
         except Exception as e:
             optimization['status'] = 'failed'
             optimization['error'] = str(e)
-            logger.error(f"     ❌ Memory usage optimization failed: {e}")
+            logger.error("     ❌ Memory usage optimization failed: %s", e)
         
         return optimization
 
@@ -588,28 +891,11 @@ class PerformanceOptimizer:
         }
         
         try:
-            # Enable cache warming
-            caching_config = self.config.setdefault('caching', {})
-            caching_config['warming'] = {
-                'enabled': True,
-                'preload_popular': True,
-                'warm_on_startup': True
-            }
+            # Cache warming, TTL values, eviction policy and statistics
+            _deep_merge(self.config, _CACHE_PATCH)
             optimization['actions_taken'].append('Enabled cache warming')
-            
-            # Optimize cache TTL values
-            caching_config.setdefault('llm_responses', {})['ttl'] = 7200  # 2 hours
-            caching_config.setdefault('workflow_results', {})['ttl'] = 3600  # 1 hour
-            caching_config.setdefault('skill_results', {})['ttl'] = 1800  # 30 minutes
-            
             optimization['actions_taken'].append('Optimized cache TTL values')
-            
-            # Enable intelligent cache eviction
-            caching_config['eviction_policy'] = 'lru_with_frequency'
             optimization['actions_taken'].append('Enabled intelligent cache eviction')
-            
-            # Enable cache statistics
-            caching_config['statistics'] = True
             optimization['actions_taken'].append('Enabled cache performance statistics')
             
             logger.info("     ✅ Cache performance optimization completed")
@@ -617,7 +903,7 @@ class PerformanceOptimizer:
         except Exception as e:
             optimization['status'] = 'failed'
             optimization['error'] = str(e)
-            logger.error(f"     ❌ Cache performance optimization failed: {e}")
+            logger.error("     ❌ Cache performance optimization failed: %s", e)
         
         return optimization
 
@@ -633,27 +919,13 @@ class PerformanceOptimizer:
         }
         
         try:
-            # Enable async processing where possible
-            self.config.setdefault('performance', {})['async_processing'] = True
+            # Async processing, logging, connection pooling, viewer settings
+            # and profiling
+            _deep_merge(self.config, _GENERAL_PATCH)
             optimization['actions_taken'].append('Enabled asynchronous processing')
-            
-            # Optimize logging performance
-            self.config.setdefault('logging', {})['async_logging'] = True
-            self.config['logging']['buffer_size'] = 1000
             optimization['actions_taken'].append('Optimized logging performance')
-            
-            # Enable connection pooling
-            self.config.setdefault('blender', {})['connection_pooling'] = True
             optimization['actions_taken'].append('Enabled Blender connection pooling')
-            
-            # Optimize viewer performance
-            viewer_config = self.config.setdefault('viewer', {})
-            viewer_config['quality'] = 'balanced'  # Balance between quality and performance
-            viewer_config['frame_rate_limit'] = 30  # Limit FPS to save resources
             optimization['actions_taken'].append('Optimized viewer performance settings')
-            
-            # Enable performance profiling
-            self.config.setdefault('performance', {})['profiling_enabled'] = True
             optimization['actions_taken'].append('Enabled performance profiling')
             
             logger.info("     ✅ General optimizations completed")
@@ -661,7 +933,7 @@ class PerformanceOptimizer:
         except Exception as e:
             optimization['status'] = 'failed'
             optimization['error'] = str(e)
-            logger.error(f"     ❌ General optimization failed: {e}")
+            logger.error("     ❌ General optimization failed: %s", e)
         
         return optimization
 
@@ -669,8 +941,15 @@ class PerformanceOptimizer:
         """Validate performance improvements after optimization"""
         logger.info("   Validating performance improvements...")
         
-        # Re-establish performance metrics after optimization
-        validation_results = await self._establish_performance_baseline()
+        # The optimizations patched self.config, so boot the agent and
+        # workflow manager again from it; the monitor and engine stay shared
+        self._agent = _shared_agent(self.config)
+        _WORKFLOW_MANAGER_CACHE.pop('default', None)
+        self._wm = _shared_workflow_manager()
+        
+        # Re-measure performance after optimization on live figures
+        self._sys = SystemSnapshot.capture()
+        validation_results = await self._measure_metrics()
         
         logger.info("   ✅ Performance validation completed")
         
@@ -680,74 +959,37 @@ class PerformanceOptimizer:
         """Calculate performance improvements"""
         logger.info("   Calculating performance improvements...")
         
-        improvements = {}
+        baseline_values = _flatten_metrics(baseline)
+        final_values = _flatten_metrics(final)
         
-        # Workflow time improvement
-        baseline_workflow_time = baseline['workflow_performance']['avg_workflow_time']
-        final_workflow_time = final['workflow_performance']['avg_workflow_time']
-        
-        if baseline_workflow_time > 0:
-            workflow_improvement = (baseline_workflow_time - final_workflow_time) / baseline_workflow_time * 100
-            improvements['workflow_time'] = {
-                'baseline': baseline_workflow_time,
-                'final': final_workflow_time,
-                'improvement_percent': workflow_improvement,
-                'target_met': final_workflow_time <= 60.0
-            }
+        # Percentage improvement for every metric in one pass; metrics with a
+        # zero baseline report 0% rather than dividing by zero
+        has_baseline = baseline_values > 0
+        improvement_percent = _improvement_percent(baseline_values, final_values)
+        targets_met = final_values <= _IMPROVEMENT_TARGETS
         
-        # Response time improvement
-        baseline_response_time = baseline['response_times']['avg_response_time']
-        final_response_time = final['response_times']['avg_response_time']
-        
-        if baseline_response_time > 0:
-            response_improvement = (baseline_response_time - final_response_time) / baseline_response_time * 100
-            improvements['response_time'] = {
-                'baseline': baseline_response_time,
-                'final': final_response_time,
-                'improvement_percent': response_improvement,
-                'target_met': final_response_time <= 2.0
+        improvements = {}
+        for i, (name, _, _, requires_baseline) in enumerate(_IMPROVEMENT_METRICS):
+            if requires_baseline and not has_baseline[i]:
+                continue
+            improvements[name] = {
+                'baseline': float(baseline_values[i]),
+                'final': float(final_values[i]),
+                'improvement_percent': float(improvement_percent[i]),
+                'target_met': bool(targets_met[i])
             }
         
-        # System resource improvements
-        baseline_cpu = baseline['system_resources']['cpu_usage']
-        final_cpu = final['system_resources']['cpu_usage']
-        
-        cpu_improvement = (baseline_cpu - final_cpu) / baseline_cpu * 100 if baseline_cpu > 0 else 0
-        improvements['cpu_usage'] = {
-            'baseline': baseline_cpu,
-            'final': final_cpu,
-            'improvement_percent': cpu_improvement,
-            'target_met': final_cpu <= 80.0
-        }
-        
-        baseline_memory = baseline['system_resources']['memory_usage']
-        final_memory = final['system_resources']['memory_usage']
-        
-        memory_improvement = (baseline_memory - final_memory) / baseline_memory * 100 if baseline_memory > 0 else 0
-        improvements['memory_usage'] = {
-            'baseline': baseline_memory,
-            'final': final_memory,
-            'improvement_percent': memory_improvement,
-            'target_met': final_memory <= 75.0
-        }
-        
         logger.info("   ✅ Performance improvements calculated")
         
         return improvements
 
     def _determine_optimization_status(self, improvements: Dict[str, Any]) -> str:
         """Determine overall optimization status"""
-        targets_met = 0
-        total_targets = 0
-        
-        for metric, data in improvements.items():
-            total_targets += 1
-            if data.get('target_met', False):
-                targets_met += 1
-        
-        if total_targets == 0:
+        total_targets = len(improvements)
+        if not total_targets:
             return 'unknown'
         
+        targets_met = sum(1 for data in improvements.values() if data.get('target_met', False))
         success_rate = targets_met / total_targets
         
         if success_rate >= 0.9:
@@ -761,9 +1003,13 @@ class PerformanceOptimizer:
 
     def _print_optimization_summary(self, summary: Dict[str, Any]):
         """Print comprehensive optimization summary"""
-        logger.info("\n" + "=" * 60)
-        logger.info("⚡ PERFORMANCE OPTIMIZATION SUMMARY")
-        logger.info("=" * 60)
+        # Collect the report and emit it as a single log record
+        lines: List[str] = []
+        ap = lines.append
+        
+        ap("\n" + "=" * 60)
+        ap("⚡ PERFORMANCE OPTIMIZATION SUMMARY")
+        ap("=" * 60)
         
         # Overall status
         status_emoji = {
@@ -775,69 +1021,71 @@ class PerformanceOptimizer:
         }
         
         status = summary['optimization_status']
-        logger.info(f"Optimization Status: {status_emoji.get(status, '❓')} {status.upper()}")
+        ap(f"Optimization Status: {status_emoji.get(status, '❓')} {status.upper()}")
         
         # Bottlenecks found
         bottlenecks = summary['bottlenecks_found']
-        logger.info(f"\n🔍 Bottlenecks Identified: {len(bottlenecks)}")
+        ap(f"\n🔍 Bottlenecks Identified: {len(bottlenecks)}")
         for bottleneck in bottlenecks:
-            logger.info(f"   • {bottleneck['type']}: {bottleneck['description']}")
+            ap(f"   • {bottleneck.type}: {bottleneck.description}")
         
         # Optimizations applied
         optimizations = summary['optimizations_applied']
-        logger.info(f"\n⚡ Optimizations Applied: {len(optimizations)}")
+        ap(f"\n⚡ Optimizations Applied: {len(optimizations)}")
         for opt in optimizations:
-            logger.info(f"   • {opt['type']}: {opt['expected_improvement']}")
+            ap(f"   • {opt['type']}: {opt['expected_improvement']}")
             for action in opt.get('actions_taken', []):
-                logger.info(f"     - {action}")
+                ap(f"     - {action}")
         
         # Performance improvements
         improvements = summary.get('improvement_metrics', {})
-        logger.info(f"\n📈 Performance Improvements:")
+        ap(f"\n📈 Performance Improvements:")
         
         for metric, data in improvements.items():
             improvement_pct = data.get('improvement_percent', 0)
             target_met = data.get('target_met', False)
             status_icon = "✅" if target_met else "⚠️"
             
-            logger.info(f"   {status_icon} {metric}: {improvement_pct:+.1f}% improvement")
-            logger.info(f"     Baseline: {data.get('baseline', 0):.3f} → Final: {data.get('final', 0):.3f}")
+            ap(f"   {status_icon} {metric}: {improvement_pct:+.1f}% improvement")
+            ap(f"     Baseline: {data.get('baseline', 0):.3f} → Final: {data.get('final', 0):.3f}")
         
         # Sub-1-minute workflow target validation
         workflow_data = improvements.get('workflow_time', {})
         final_workflow_time = workflow_data.get('final', 0)
         target_met = workflow_data.get('target_met', False)
         
-        logger.info(f"\n🎯 Sub-1-Minute Workflow Target:")
+        ap(f"\n🎯 Sub-1-Minute Workflow Target:")
         if target_met:
-            logger.info(f"   ✅ TARGET MET: Average workflow time {final_workflow_time:.1f}s (< 60s)")
+            ap(f"   ✅ TARGET MET: Average workflow time {final_workflow_time:.1f}s (< 60s)")
         else:
-            logger.info(f"   ❌ Target missed: Average workflow time {final_workflow_time:.1f}s (target: 60s)")
+            ap(f"   ❌ Target missed: Average workflow time {final_workflow_time:.1f}s (target: 60s)")
         
         # Final recommendations
-        logger.info(f"\n💡 Optimization Assessment:")
+        ap(f"\n💡 Optimization Assessment:")
         if status == 'excellent':
-            logger.info("   🎉 Performance optimization is excellent! Platform ready for production.")
+            ap("   🎉 Performance optimization is excellent! Platform ready for production.")
         elif status == 'good':
-            logger.info("   ✅ Performance optimization is solid. Minor fine-tuning recommended.")
+            ap("   ✅ Performance optimization is solid. Minor fine-tuning recommended.")
         elif status == 'acceptable':
-            logger.info("   ⚠️  Performance optimization is functional but needs more improvements.")
+            ap("   ⚠️  Performance optimization is functional but needs more improvements.")
         else:
-            logger.info("   ❌ Performance optimization requires significant improvements.")
+            ap("   ❌ Performance optimization requires significant improvements.")
+        
+        ap("\n🎯 100% PLATFORM COMPLETION STATUS:")
+        ap("   Integration Testing (1%): ✅ COMPLETED")
+        ap("   Performance Optimization (1%): ✅ COMPLETED")
+        ap("   Final Documentation (1%): ✅ COMPLETED")
         
-        logger.info("\n🎯 100% PLATFORM COMPLETION STATUS:")
-        logger.info("   Integration Testing (1%): ✅ COMPLETED")
-        logger.info("   Performance Optimization (1%): ✅ COMPLETED")
-        logger.info("   Final Documentation (1%): ✅ COMPLETED")
+        logger.info('\n'.join(lines))
 
     async def save_optimized_config(self):
         """Save optimized configuration to file"""
         logger.info("💾 Saving optimized configuration...")
         
-        # Save optimized config
+        # Save optimized config off the event loop
+        loop = asyncio.get_running_loop()
         optimized_config_path = Path("config_optimized.yaml")
-        with open(optimized_config_path, 'w') as f:
-            yaml.dump(self.config, f, default_flow_style=False, indent=2)
+        await loop.run_in_executor(None, _write_yaml_atomic, optimized_config_path, self.config)
         
         logger.info(f"✅ Optimized configuration saved to: {optimized_config_path}")
         
@@ -845,8 +1093,7 @@ class PerformanceOptimizer:
         original_config_path = Path("config.yaml")
         if original_config_path.exists():
             backup_path = Path("config_backup.yaml")
-            with open(original_config_path, 'r') as src, open(backup_path, 'w') as dst:
-                dst.write(src.read())
+            await loop.run_in_executor(None, shutil.copyfile, original_config_path, backup_path)
             logger.info(f"💾 Original configuration backed up to: {backup_path}")
 
 
@@ -865,11 +1112,10 @@ async def main():
         # Save optimized configuration
         await optimizer.save_optimized_config()
         
-        # Save optimization results
+        # Save optimization results off the event loop
         results_file = Path("performance_optimization_results.json")
-        with open(results_file, 'w') as f:
-            json_results = json.loads(json.dumps(results, default=str))
-            json.dump(json_results, f, indent=2)
+        payload = _dump_json(results)
+        await asyncio.get_running_loop().run_in_executor(None, results_file.write_bytes, payload)
         
         print(f"\n📁 Optimization results saved to: {results_file}")
         
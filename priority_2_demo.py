@@ -4,10 +4,181 @@ Priority 2 Intelligence Layer Demonstration
 Shows enhanced capabilities without requiring full environment setup
 """
 
+from __future__ import annotations
+
 import asyncio
-import json
-from datetime import datetime
-from typing import Dict, Any, List
+import copy
+import heapq
+import re
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, NamedTuple, Sequence, Tuple
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+
+# Intent keywords in priority order; the first group with a hit wins
+_INTENT_KEYWORDS = (
+    ('create', ('create', 'add', 'make', 'generate')),
+    ('modify', ('modify', 'change', 'edit', 'update')),
+    ('delete', ('delete', 'remove', 'clear')),
+    ('lighting', ('light', 'illuminate', 'lighting')),
+    ('material', ('material', 'texture', 'shader')),
+)
+_CONFIDENCE_KEYWORDS = frozenset({'create', 'sphere', 'cube', 'material', 'light', 'metallic', 'glass'})
+# Parameter tables; insertion order is the precedence when several keywords match
+_OBJECTS = {'sphere': 'sphere', 'cube': 'cube', 'cylinder': 'cylinder'}
+_MATERIALS = {
+    'metallic': {'material_type': 'metallic', 'metallic': 0.9, 'roughness': 0.1},
+    'glass': {'material_type': 'glass', 'transmission': 1.0, 'ior': 1.45},
+}
+_COLORS = {
+    'red': (1.0, 0.0, 0.0, 1.0),
+    'blue': (0.0, 0.0, 1.0, 1.0),
+    'green': (0.0, 1.0, 0.0, 1.0),
+}
+_OBJECT_TYPES = ('sphere', 'cube', 'cylinder', 'plane', 'torus', 'cone')
+_SUGGESTIONS_BY_INTENT: Dict[str, Tuple[str, ...]] = {
+    'create': (
+        "Consider adding subdivision surface for smoother geometry",
+        "Apply appropriate materials after creation",
+        "Position object at origin [0,0,0] by default"
+    ),
+    'material': (
+        "Use PBR workflow for realistic materials",
+        "Consider adding normal maps for surface detail",
+        "Adjust roughness and metallic values for desired look"
+    ),
+    'lighting': (
+        "Use three-point lighting for professional results",
+        "Consider HDRI environment lighting",
+        "Adjust light energy and color temperature"
+    ),
+}
+
+_KEYWORDS = frozenset(
+    [word for _, words in _INTENT_KEYWORDS for word in words]
+    + list(_CONFIDENCE_KEYWORDS) + list(_OBJECTS) + list(_MATERIALS) + list(_COLORS)
+    + list(_OBJECT_TYPES)
+)
+# Zero-width lookahead so every start position is tested, longest keyword first
+_KEYWORD_RE = re.compile(
+    '(?=(%s))' % '|'.join(map(re.escape, sorted(_KEYWORDS, key=len, reverse=True)))
+)
+# A match also covers every shorter keyword it contains (e.g. 'lighting' -> 'light')
+_KEYWORD_CLOSURE = {
+    keyword: frozenset(other for other in _KEYWORDS if other in keyword)
+    for keyword in _KEYWORDS
+}
+
+
+def _scan_keywords(command_lower: str) -> FrozenSet[str]:
+    """Collect every known keyword occurring in the command in a single regex pass"""
+    hits = set()
+    for match in _KEYWORD_RE.finditer(command_lower):
+        hits |= _KEYWORD_CLOSURE[match.group(1)]
+    return frozenset(hits)
+
+
+def _analyze_intent(hits: FrozenSet[str]) -> str:
+    """Analyze primary intent from command"""
+    for intent, words in _INTENT_KEYWORDS:
+        if not hits.isdisjoint(words):
+            return intent
+    return 'analyze'
+
+
+def _calculate_confidence(hits: FrozenSet[str]) -> float:
+    """Calculate confidence based on command clarity"""
+    found_keywords = len(_CONFIDENCE_KEYWORDS & hits)
+    return min(0.3 + (found_keywords * 0.15), 0.95)
+
+
+def _extract_parameters(hits: FrozenSet[str]) -> Dict[str, Any]:
+    """Extract parameters from natural language"""
+    params = {}
+    
+    # Object types
+    object_type = next((value for key, value in _OBJECTS.items() if key in hits), None)
+    if object_type:
+        params['object_type'] = object_type
+    
+    # Materials
+    material = next((value for key, value in _MATERIALS.items() if key in hits), None)
+    if material:
+        params.update(material)
+    
+    # Colors
+    color = next((value for key, value in _COLORS.items() if key in hits), None)
+    if color:
+        params['color'] = list(color)
+    
+    return params
+
+
+def _identify_objects(hits: FrozenSet[str]) -> List[str]:
+    """Identify objects mentioned in command"""
+    return [obj_type for obj_type in _OBJECT_TYPES if obj_type in hits]
+
+
+def _generate_suggestions(intent: str) -> Tuple[str, ...]:
+    """Generate intelligent suggestions"""
+    return _SUGGESTIONS_BY_INTENT.get(intent, ())
+
+
+def _token_estimate(command: str) -> int:
+    """Simulate token usage for a command"""
+    return len(command.split()) * 4
+
+
+class CommandAnalysis(NamedTuple):
+    """Cached analysis of a single command string"""
+    intent: str
+    confidence: float
+    parameters: Dict[str, Any]
+    suggestions: Tuple[str, ...]
+    objects: Tuple[str, ...]
+    tokens_used: int
+
+
+@lru_cache(maxsize=4096)
+def _parse_command(command_lower: str) -> CommandAnalysis:
+    """Analyze a lowercased command once; repeated commands are served from the cache"""
+    hits = _scan_keywords(command_lower)
+    intent = _analyze_intent(hits)
+    return CommandAnalysis(
+        intent=intent,
+        confidence=_calculate_confidence(hits),
+        parameters=_extract_parameters(hits),
+        suggestions=_generate_suggestions(intent),
+        objects=tuple(_identify_objects(hits)),
+        tokens_used=_token_estimate(command_lower)
+    )
+
+
+@dataclass(frozen=True)
+class Template:
+    """Read-only workflow template used by the demo"""
+    __slots__ = (
+        'id', 'name', 'description', 'category', 'complexity',
+        'estimated_time', 'success_rate', 'usage_count', 'steps', 'tags'
+    )
+    id: str
+    name: str
+    description: str
+    category: str
+    complexity: str
+    estimated_time: int
+    success_rate: float
+    usage_count: int
+    steps: Tuple[Tuple[str, int], ...]  # (name, time in seconds)
+    tags: FrozenSet[str]
 
 
 class LLMIntegrationDemo:
@@ -23,118 +194,27 @@ class LLMIntegrationDemo:
     
     async def enhance_command_understanding(self, command: str, context: Dict[str, Any], session_id: str) -> Dict[str, Any]:
         """Demo: Enhanced command understanding with LLM-like intelligence"""
+        started = time.perf_counter_ns()
         self.usage_stats['requests_made'] += 1
         
         # Simulate intelligent command analysis
+        analysis = _parse_command(command.lower())
         enhanced_understanding = {
-            'enhanced_intent': self._analyze_intent(command),
-            'confidence': self._calculate_confidence(command),
-            'parameters': self._extract_parameters(command),
-            'suggestions': self._generate_suggestions(command),
-            'objects': self._identify_objects(command),
+            'enhanced_intent': analysis.intent,
+            'confidence': analysis.confidence,
+            # Callers own the returned containers; the cached analysis must not change
+            'parameters': copy.deepcopy(analysis.parameters),
+            'suggestions': list(analysis.suggestions),
+            'objects': list(analysis.objects),
             'metadata': {
                 'provider': 'demo_llm',
-                'tokens_used': len(command.split()) * 4,  # Simulate token usage
-                'processing_time': 0.1
+                'tokens_used': analysis.tokens_used,
+                'processing_time': (time.perf_counter_ns() - started) / 1e9
             }
         }
         
         self.usage_stats['tokens_used'] += enhanced_understanding['metadata']['tokens_used']
         return enhanced_understanding
-    
-    def _analyze_intent(self, command: str) -> str:
-        """Analyze primary intent from command"""
-        command_lower = command.lower()
-        
-        if any(word in command_lower for word in ['create', 'add', 'make', 'generate']):
-            return 'create'
-        elif any(word in command_lower for word in ['modify', 'change', 'edit', 'update']):
-            return 'modify'
-        elif any(word in command_lower for word in ['delete', 'remove', 'clear']):
-            return 'delete'
-        elif any(word in command_lower for word in ['light', 'illuminate', 'lighting']):
-            return 'lighting'
-        elif any(word in command_lower for word in ['material', 'texture', 'shader']):
-            return 'material'
-        else:
-            return 'analyze'
-    
-    def _calculate_confidence(self, command: str) -> float:
-        """Calculate confidence based on command clarity"""
-        keywords = ['create', 'sphere', 'cube', 'material', 'light', 'metallic', 'glass']
-        found_keywords = sum(1 for word in keywords if word in command.lower())
-        return min(0.3 + (found_keywords * 0.15), 0.95)
-    
-    def _extract_parameters(self, command: str) -> Dict[str, Any]:
-        """Extract parameters from natural language"""
-        params = {}
-        command_lower = command.lower()
-        
-        # Object types
-        if 'sphere' in command_lower:
-            params['object_type'] = 'sphere'
-        elif 'cube' in command_lower:
-            params['object_type'] = 'cube'
-        elif 'cylinder' in command_lower:
-            params['object_type'] = 'cylinder'
-        
-        # Materials
-        if 'metallic' in command_lower:
-            params['material_type'] = 'metallic'
-            params['metallic'] = 0.9
-            params['roughness'] = 0.1
-        elif 'glass' in command_lower:
-            params['material_type'] = 'glass'
-            params['transmission'] = 1.0
-            params['ior'] = 1.45
-        
-        # Colors
-        if 'red' in command_lower:
-            params['color'] = [1.0, 0.0, 0.0, 1.0]
-        elif 'blue' in command_lower:
-            params['color'] = [0.0, 0.0, 1.0, 1.0]
-        elif 'green' in command_lower:
-            params['color'] = [0.0, 1.0, 0.0, 1.0]
-        
-        return params
-    
-    def _identify_objects(self, command: str) -> List[str]:
-        """Identify objects mentioned in command"""
-        objects = []
-        command_lower = command.lower()
-        
-        object_types = ['sphere', 'cube', 'cylinder', 'plane', 'torus', 'cone']
-        for obj_type in object_types:
-            if obj_type in command_lower:
-                objects.append(obj_type)
-        
-        return objects
-    
-    def _generate_suggestions(self, command: str) -> List[str]:
-        """Generate intelligent suggestions"""
-        suggestions = []
-        intent = self._analyze_intent(command)
-        
-        if intent == 'create':
-            suggestions.extend([
-                "Consider adding subdivision surface for smoother geometry",
-                "Apply appropriate materials after creation",
-                "Position object at origin [0,0,0] by default"
-            ])
-        elif intent == 'material':
-            suggestions.extend([
-                "Use PBR workflow for realistic materials",
-                "Consider adding normal maps for surface detail",
-                "Adjust roughness and metallic values for desired look"
-            ])
-        elif intent == 'lighting':
-            suggestions.extend([
-                "Use three-point lighting for professional results",
-                "Consider HDRI environment lighting",
-                "Adjust light energy and color temperature"
-            ])
-        
-        return suggestions
 
 
 class WorkflowManagerDemo:
@@ -142,160 +222,206 @@ class WorkflowManagerDemo:
     
     def __init__(self):
         self.templates = self._create_demo_templates()
+        
+        # Templates are static, so order them by usage and success rate once
+        self._sorted_templates = sorted(
+            self.templates.values(),
+            key=lambda x: (x.usage_count, x.success_rate),
+            reverse=True
+        )
+        self._by_category = defaultdict(list)
+        for template in self._sorted_templates:
+            self._by_category[template.category].append(template)
+        
+        # Column arrays of the scoring attributes for recommend_templates
+        self._template_list = list(self.templates.values())
+        if _HAS_NUMPY:
+            self._succ = np.array([t.success_rate for t in self._template_list])
+            self._usage = np.array([t.usage_count for t in self._template_list], dtype=float)
+            self._complexity = np.array([t.complexity for t in self._template_list], dtype='U16')
+            self._tag_index = {
+                tag: i for i, tag in enumerate(sorted({tag for t in self._template_list for tag in t.tags}))
+            }
+            self._tag_matrix = np.zeros((len(self._template_list), len(self._tag_index)), dtype=np.uint8)
+            for row, template in enumerate(self._template_list):
+                for tag in template.tags:
+                    self._tag_matrix[row, self._tag_index[tag]] = 1
+        
         self.analytics = {
             'total_usage': 0,
             'success_rate': 0.85,
             'average_execution_time': 45
         }
     
-    def _create_demo_templates(self) -> Dict[str, Dict[str, Any]]:
+    def _create_demo_templates(self) -> Dict[str, Template]:
         """Create demonstration workflow templates"""
         return {
-            'professional_lighting': {
-                'id': 'professional_lighting',
-                'name': 'Professional Three-Point Lighting',
-                'description': 'Industry-standard lighting setup',
-                'category': 'lighting',
-                'complexity': 'intermediate',
-                'estimated_time': 55,
-                'success_rate': 0.92,
-                'usage_count': 127,
-                'steps': [
-                    {'name': 'Create Key Light', 'time': 15},
-                    {'name': 'Create Fill Light', 'time': 15},
-                    {'name': 'Create Rim Light', 'time': 15},
-                    {'name': 'Configure Shadows', 'time': 10}
-                ],
-                'tags': ['lighting', 'professional', 'cinematic']
-            },
-            'advanced_pbr_material': {
-                'id': 'advanced_pbr_material',
-                'name': 'Advanced PBR Material Setup',
-                'description': 'Photorealistic material creation',
-                'category': 'materials',
-                'complexity': 'intermediate',
-                'estimated_time': 35,
-                'success_rate': 0.88,
-                'usage_count': 89,
-                'steps': [
-                    {'name': 'Load Textures', 'time': 10},
-                    {'name': 'Setup Normal Maps', 'time': 10},
-                    {'name': 'Configure PBR Properties', 'time': 15}
-                ],
-                'tags': ['pbr', 'materials', 'textures']
-            },
-            'procedural_animation': {
-                'id': 'procedural_animation',
-                'name': 'Procedural Animation Setup',
-                'description': 'Automated animation systems',
-                'category': 'animation',
-                'complexity': 'advanced',
-                'estimated_time': 75,
-                'success_rate': 0.78,
-                'usage_count': 34,
-                'steps': [
-                    {'name': 'Setup Controllers', 'time': 20},
-                    {'name': 'Add Modifiers', 'time': 25},
-                    {'name': 'Configure Drivers', 'time': 30}
-                ],
-                'tags': ['animation', 'procedural', 'advanced']
-            },
-            'particle_effects': {
-                'id': 'particle_effects',
-                'name': 'Particle System Effects',
-                'description': 'Complex particle simulations',
-                'category': 'effects',
-                'complexity': 'advanced',
-                'estimated_time': 60,
-                'success_rate': 0.82,
-                'usage_count': 56,
-                'steps': [
-                    {'name': 'Create Emitter', 'time': 10},
-                    {'name': 'Configure Particles', 'time': 20},
-                    {'name': 'Add Physics', 'time': 15},
-                    {'name': 'Setup Rendering', 'time': 15}
-                ],
-                'tags': ['particles', 'effects', 'simulation']
-            },
-            'architectural_scene': {
-                'id': 'architectural_scene',
-                'name': 'Architectural Scene Setup',
-                'description': 'Complete architectural visualization workflow',
-                'category': 'modeling',
-                'complexity': 'expert',
-                'estimated_time': 120,
-                'success_rate': 0.75,
-                'usage_count': 23,
-                'steps': [
-                    {'name': 'Import Base Geometry', 'time': 20},
-                    {'name': 'Create Materials', 'time': 40},
-                    {'name': 'Setup Lighting', 'time': 30},
-                    {'name': 'Configure Camera', 'time': 15},
-                    {'name': 'Optimize Rendering', 'time': 15}
-                ],
-                'tags': ['architecture', 'visualization', 'complex']
-            }
+            'professional_lighting': Template(
+                id='professional_lighting',
+                name='Professional Three-Point Lighting',
+                description='Industry-standard lighting setup',
+                category='lighting',
+                complexity='intermediate',
+                estimated_time=55,
+                success_rate=0.92,
+                usage_count=127,
+                steps=(
+                    ('Create Key Light', 15),
+                    ('Create Fill Light', 15),
+                    ('Create Rim Light', 15),
+                    ('Configure Shadows', 10)
+                ),
+                tags=frozenset({'lighting', 'professional', 'cinematic'})
+            ),
+            'advanced_pbr_material': Template(
+                id='advanced_pbr_material',
+                name='Advanced PBR Material Setup',
+                description='Photorealistic material creation',
+                category='materials',
+                complexity='intermediate',
+                estimated_time=35,
+                success_rate=0.88,
+                usage_count=89,
+                steps=(
+                    ('Load Textures', 10),
+                    ('Setup Normal Maps', 10),
+                    ('Configure PBR Properties', 15)
+                ),
+                tags=frozenset({'pbr', 'materials', 'textures'})
+            ),
+            'procedural_animation': Template(
+                id='procedural_animation',
+                name='Procedural Animation Setup',
+                description='Automated animation systems',
+                category='animation',
+                complexity='advanced',
+                estimated_time=75,
+                success_rate=0.78,
+                usage_count=34,
+                steps=(
+                    ('Setup Controllers', 20),
+                    ('Add Modifiers', 25),
+                    ('Configure Drivers', 30)
+                ),
+                tags=frozenset({'animation', 'procedural', 'advanced'})
+            ),
+            'particle_effects': Template(
+                id='particle_effects',
+                name='Particle System Effects',
+                description='Complex particle simulations',
+                category='effects',
+                complexity='advanced',
+                estimated_time=60,
+                success_rate=0.82,
+                usage_count=56,
+                steps=(
+                    ('Create Emitter', 10),
+                    ('Configure Particles', 20),
+                    ('Add Physics', 15),
+                    ('Setup Rendering', 15)
+                ),
+                tags=frozenset({'particles', 'effects', 'simulation'})
+            ),
+            'architectural_scene': Template(
+                id='architectural_scene',
+                name='Architectural Scene Setup',
+                description='Complete architectural visualization workflow',
+                category='modeling',
+                complexity='expert',
+                estimated_time=120,
+                success_rate=0.75,
+                usage_count=23,
+                steps=(
+                    ('Import Base Geometry', 20),
+                    ('Create Materials', 40),
+                    ('Setup Lighting', 30),
+                    ('Configure Camera', 15),
+                    ('Optimize Rendering', 15)
+                ),
+                tags=frozenset({'architecture', 'visualization', 'complex'})
+            )
         }
     
-    async def list_templates(self, category: str | None = None) -> List[Dict[str, Any]]:
+    async def list_templates(self, category: str | None = None) -> List[Template]:
         """List workflow templates with optional filtering"""
-        templates = list(self.templates.values())
-        
         if category:
-            templates = [t for t in templates if t['category'] == category]
-        
-        # Sort by usage and success rate
-        templates.sort(key=lambda x: (x['usage_count'], x['success_rate']), reverse=True)
-        return templates
+            return list(self._by_category.get(category, ()))
+        return list(self._sorted_templates)
     
     async def recommend_templates(self, user_context: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate intelligent template recommendations"""
         skill_level = user_context.get('skill_level', 'intermediate')
         interests = user_context.get('interests', [])
         
-        recommendations = []
+        scores = self._score_templates(skill_level, interests)
+        top = heapq.nlargest(3, range(len(self._template_list)), key=scores.__getitem__)
         
-        for template in self.templates.values():
-            score = 0
-            
-            # Skill level matching
-            if template['complexity'] == skill_level:
-                score += 3
-            elif skill_level == 'beginner' and template['complexity'] == 'simple':
-                score += 3
-            elif skill_level == 'expert' and template['complexity'] == 'advanced':
-                score += 2
-            
-            # Interest matching
-            if any(interest in template['tags'] for interest in interests):
-                score += 2
-            
-            # Success rate bonus
-            score += template['success_rate'] * 2
-            
-            # Popularity bonus
-            score += min(template['usage_count'] / 50, 2)
-            
-            recommendations.append({
-                'template': template,
-                'score': score,
-                'reason': self._generate_reason(template, user_context)
-            })
+        return [
+            {
+                'template': self._template_list[i],
+                'score': float(scores[i]),
+                'reason': self._generate_reason(self._template_list[i], user_context)
+            }
+            for i in top
+        ]
+    
+    def _score_templates(self, skill_level: str, interests: List[str]) -> Sequence[float]:
+        """Score every template against a user's skill level and interests"""
+        if not _HAS_NUMPY:
+            interests_set = frozenset(interests)
+            return [self._score_template(t, skill_level, interests_set) for t in self._template_list]
+        
+        # Skill level matching
+        skill = (self._complexity == skill_level) * 3.0
+        if skill_level == 'beginner':
+            skill += (self._complexity == 'simple') * 3.0
+        elif skill_level == 'expert':
+            skill += (self._complexity == 'advanced') * 2.0
+        
+        # Interest matching
+        interests_vec = np.zeros(len(self._tag_index), dtype=np.uint8)
+        for interest in interests:
+            if interest in self._tag_index:
+                interests_vec[self._tag_index[interest]] = 1
+        interest_match = (self._tag_matrix @ interests_vec > 0) * 2.0
+        
+        # Success rate and popularity bonuses
+        return skill + interest_match + self._succ * 2 + np.minimum(self._usage / 50, 2)
+    
+    def _score_template(self, template: Template, skill_level: str, interests: FrozenSet[str]) -> float:
+        """Score a single template without NumPy"""
+        score = 0
+        
+        # Skill level matching
+        if template.complexity == skill_level:
+            score += 3
+        elif skill_level == 'beginner' and template.complexity == 'simple':
+            score += 3
+        elif skill_level == 'expert' and template.complexity == 'advanced':
+            score += 2
+        
+        # Interest matching
+        if not template.tags.isdisjoint(interests):
+            score += 2
+        
+        # Success rate bonus
+        score += template.success_rate * 2
         
-        recommendations.sort(key=lambda x: x['score'], reverse=True)
-        return recommendations[:3]
+        # Popularity bonus
+        score += min(template.usage_count / 50, 2)
+        return score
     
-    def _generate_reason(self, template: Dict[str, Any], context: Dict[str, Any]) -> str:
+    def _generate_reason(self, template: Template, context: Dict[str, Any]) -> str:
         """Generate recommendation reasoning"""
         reasons = []
         
-        if template['complexity'] == context.get('skill_level'):
-            reasons.append(f"matches your {template['complexity']} skill level")
+        if template.complexity == context.get('skill_level'):
+            reasons.append(f"matches your {template.complexity} skill level")
         
-        if template['success_rate'] > 0.9:
+        if template.success_rate > 0.9:
             reasons.append("has high success rate")
         
-        if template['usage_count'] > 50:
+        if template.usage_count > 50:
             reasons.append("is popular among users")
         
         return ', '.join(reasons) if reasons else 'general recommendation'
@@ -303,19 +429,21 @@ class WorkflowManagerDemo:
     async def get_analytics(self) -> Dict[str, Any]:
         """Get workflow analytics"""
         total_templates = len(self.templates)
-        categories = {}
-        complexities = {}
+        categories = Counter()
+        complexities = Counter()
+        total_success = 0.0
         
         for template in self.templates.values():
-            categories[template['category']] = categories.get(template['category'], 0) + 1
-            complexities[template['complexity']] = complexities.get(template['complexity'], 0) + 1
+            categories[template.category] += 1
+            complexities[template.complexity] += 1
+            total_success += template.success_rate
         
         return {
             'total_templates': total_templates,
-            'category_distribution': categories,
-            'complexity_distribution': complexities,
-            'average_success_rate': sum(t['success_rate'] for t in self.templates.values()) / total_templates,
-            'most_popular': sorted(self.templates.values(), key=lambda x: x['usage_count'], reverse=True)[:3]
+            'category_distribution': dict(categories),
+            'complexity_distribution': dict(complexities),
+            'average_success_rate': total_success / total_templates,
+            'most_popular': self._sorted_templates[:3]
         }
 
 
@@ -362,9 +490,9 @@ async def demonstrate_priority_2():
     print(f"\nAvailable Templates: {len(all_templates)}")
     
     for template in all_templates:
-        print(f"  • {template['name']} ({template['complexity']}) - {template['category']}")
-        print(f"    Success Rate: {template['success_rate']:.1%}, Usage: {template['usage_count']}")
-        print(f"    Estimated Time: {template['estimated_time']}s")
+        print(f"  • {template.name} ({template.complexity}) - {template.category}")
+        print(f"    Success Rate: {template.success_rate:.1%}, Usage: {template.usage_count}")
+        print(f"    Estimated Time: {template.estimated_time}s")
     
     # Test 3: Personalized Recommendations
     print(f"\n\n🎯 3. PERSONALIZED RECOMMENDATIONS")
@@ -394,7 +522,7 @@ async def demonstrate_priority_2():
         
         for i, rec in enumerate(recommendations, 1):
             template = rec['template']
-            print(f"  {i}. {template['name']} (score: {rec['score']:.1f})")
+            print(f"  {i}. {template.name} (score: {rec['score']:.1f})")
             print(f"     Reason: {rec['reason']}")
     
     # Test 4: Analytics and Insights
@@ -410,7 +538,7 @@ async def demonstrate_priority_2():
     
     print(f"\nMost Popular Templates:")
     for i, template in enumerate(analytics['most_popular'], 1):
-        print(f"  {i}. {template['name']} ({template['usage_count']} uses)")
+        print(f"  {i}. {template.name} ({template.usage_count} uses)")
     
     # Test 5: Usage Statistics
     print(f"\n\n💡 5. LLM USAGE STATISTICS")
@@ -11,9 +11,48 @@ import platform
 import shutil
 import json
 import argparse
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Last detected Blender path, reused for a day as long as the path still exists
+BLENDER_CACHE_PATH = Path.home() / ".miktos" / "blender.json"
+BLENDER_CACHE_TTL = 24 * 60 * 60
+
+
+# Known Blender install locations per platform, expanded once at import
+_BLENDER_CANDIDATES: Dict[str, Tuple[Path, ...]] = {
+    platform_name: tuple(Path(path).expanduser() for path in paths)
+    for platform_name, paths in {
+        "darwin": (
+            "/Applications/Blender.app",
+            "/Applications/Blender.app/Contents/MacOS/Blender",
+            "/usr/local/bin/blender",
+            "~/Applications/Blender.app"
+        ),
+        "windows": (
+            "C:\\Program Files\\Blender Foundation\\Blender 3.6\\blender.exe",
+            "C:\\Program Files\\Blender Foundation\\Blender 4.0\\blender.exe",
+            "C:\\Users\\%USERNAME%\\AppData\\Local\\Programs\\Blender Foundation\\Blender 3.6\\blender.exe",
+        ),
+        "linux": (
+            "/usr/bin/blender",
+            "/usr/local/bin/blender",
+            "/snap/bin/blender",
+            "~/Applications/blender"
+        ),
+    }.items()
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """shutil.which, looked up once per executable name."""
+    return shutil.which(name)
+
 
 class MiktosSetup:
     """Main setup class for Miktos AI Bridge Platform."""
@@ -24,12 +63,15 @@ class MiktosSetup:
         self.project_root = Path(__file__).parent.absolute()
         self.config_path = self.project_root / "config.yaml"
         self.setup_log = []
+        self._log_lock = threading.Lock()
         
     def log(self, message: str, level: str = "INFO"):
         """Log setup messages."""
         log_entry = f"[{level}] {message}"
-        self.setup_log.append(log_entry)
-        print(log_entry)
+        # Commands may run on worker threads; keep each entry whole and in log order
+        with self._log_lock:
+            self.setup_log.append(log_entry)
+            print(log_entry)
         
     def run_command(self, command: List[str], description: str) -> Tuple[bool, str]:
         """Run a system command and return success status and output."""
@@ -75,66 +117,94 @@ class MiktosSetup:
             checks["pip"] = False
             self.log("✗ pip not found", "ERROR")
             
-        # Check for git
-        success, _ = self.run_command(["git", "--version"], "Git version check")
-        checks["git"] = success
-        
-        # Check for Node.js
-        success, output = self.run_command(["node", "--version"], "Node.js version check")
-        checks["nodejs"] = success
-        if success:
-            self.log(f"✓ Node.js {output.strip()} detected")
-            
-        # Check for npm
-        success, _ = self.run_command(["npm", "--version"], "npm version check")
-        checks["npm"] = success
+        # Check for git, Node.js and npm; only their presence on PATH matters here
+        for key, tool in (("git", "git"), ("nodejs", "node"), ("npm", "npm")):
+            checks[key] = _which(tool) is not None
+            if checks[key]:
+                self.log(f"✓ {tool} found")
+            else:
+                self.log(f"✗ {tool} not found", "ERROR")
+                
+        # Node.js is the one tool whose version gets reported
+        if checks["nodejs"]:
+            success, output = self.run_command(["node", "--version"], "Node.js version check")
+            if success:
+                self.log(f"✓ Node.js {output.strip()} detected")
         
         return checks
         
+    def _load_cached_blender_path(self) -> Optional[str]:
+        """Return the cached Blender path if it is fresh and still exists."""
+        try:
+            cached = json.loads(BLENDER_CACHE_PATH.read_text())
+            if time.time() - cached["ts"] < BLENDER_CACHE_TTL and Path(cached["path"]).exists():
+                return cached["path"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+        
+    def _save_blender_path(self, blender_path: str):
+        """Remember a detected Blender path; failures only cost a re-probe next time."""
+        try:
+            BLENDER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            BLENDER_CACHE_PATH.write_text(json.dumps({"path": blender_path, "ts": time.time()}))
+        except OSError:
+            pass
+            
     def detect_blender(self) -> Optional[str]:
         """Auto-detect Blender installation."""
         self.log("Detecting Blender installation...")
         
-        possible_paths = []
+        blender_path = self._load_cached_blender_path()
+        if blender_path:
+            self.log(f"✓ Found Blender (cached): {blender_path}")
+            return blender_path
         
-        if self.platform_name == "darwin":  # macOS
-            possible_paths = [
-                "/Applications/Blender.app",
-                "/Applications/Blender.app/Contents/MacOS/Blender",
-                "/usr/local/bin/blender",
-                "~/Applications/Blender.app"
-            ]
-        elif self.platform_name == "windows":
-            possible_paths = [
-                "C:\\Program Files\\Blender Foundation\\Blender 3.6\\blender.exe",
-                "C:\\Program Files\\Blender Foundation\\Blender 4.0\\blender.exe",
-                "C:\\Users\\%USERNAME%\\AppData\\Local\\Programs\\Blender Foundation\\Blender 3.6\\blender.exe",
-            ]
-        else:  # Linux
-            possible_paths = [
-                "/usr/bin/blender",
-                "/usr/local/bin/blender",
-                "/snap/bin/blender",
-                "~/Applications/blender"
-            ]
-            
         # Try system PATH first
-        if shutil.which("blender"):
-            blender_path = shutil.which("blender")
+        blender_path = _which("blender")
+        if blender_path:
             self.log(f"✓ Found Blender in PATH: {blender_path}")
+            self._save_blender_path(blender_path)
             return blender_path
             
-        # Check known locations
-        for path in possible_paths:
-            expanded_path = Path(path).expanduser()
+        # Check known locations; any platform other than macOS or Windows is treated as Linux
+        for expanded_path in _BLENDER_CANDIDATES.get(self.platform_name, _BLENDER_CANDIDATES["linux"]):
             if expanded_path.exists():
                 self.log(f"✓ Found Blender at: {expanded_path}")
+                self._save_blender_path(str(expanded_path))
                 return str(expanded_path)
                 
         self.log("⚠ Blender not found automatically", "WARNING")
         return None
         
-    def install_python_dependencies(self) -> bool:
+    def _parallel_prefetch(self, requirements_file: Path, cache_dir: Path, workers: int = 5) -> int:
+        """Download requirement archives into cache_dir concurrently; returns how many succeeded."""
+        requirements = []
+        for line in requirements_file.read_text().splitlines():
+            requirement = line.split(" #", 1)[0].strip()
+            # Skip blanks, comments and pip options such as -r or --index-url
+            if requirement and not requirement.startswith(("#", "-")):
+                requirements.append(requirement)
+                
+        if not requirements:
+            return 0
+            
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.log(f"Prefetching {len(requirements)} packages with {workers} parallel downloads...")
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(
+                lambda requirement: self.run_command(
+                    [self.python_exec, "-m", "pip", "download", "--no-deps",
+                     "-d", str(cache_dir), requirement],
+                    f"Downloading {requirement}"
+                ),
+                requirements
+            ))
+            
+        return sum(1 for success, _ in results if success)
+        
+    def install_python_dependencies(self, parallel_downloads: int = 5) -> bool:
         """Install Python dependencies."""
         self.log("Installing Python dependencies...")
         
@@ -150,10 +220,16 @@ class MiktosSetup:
         # Install requirements
         requirements_file = self.project_root / "requirements.txt"
         if requirements_file.exists():
-            success, _ = self.run_command(
-                [self.python_exec, "-m", "pip", "install", "-r", str(requirements_file)],
-                "Installing Python packages"
-            )
+            install_command = [self.python_exec, "-m", "pip", "install", "-r", str(requirements_file)]
+            
+            if parallel_downloads > 0:
+                # Downloads run in parallel; the install itself stays a single serial pip run.
+                # The index stays enabled so transitive dependencies and failed prefetches still resolve.
+                cache_dir = self.project_root / "temp" / "wheelcache"
+                if self._parallel_prefetch(requirements_file, cache_dir, parallel_downloads):
+                    install_command += ["--find-links", str(cache_dir)]
+                    
+            success, _ = self.run_command(install_command, "Installing Python packages")
             return success
         else:
             self.log("✗ requirements.txt not found", "ERROR")
@@ -286,10 +362,20 @@ platform:
         ]
         
         try:
+            # One scandir of the project root instead of a mkdir attempt per directory
+            with os.scandir(self.project_root) as entries:
+                existing = {entry.name for entry in entries if entry.is_dir()}
+                
+            created = []
             for directory in directories:
-                dir_path = self.project_root / directory
-                dir_path.mkdir(exist_ok=True)
+                if directory not in existing:
+                    (self.project_root / directory).mkdir(exist_ok=True)
+                    created.append(directory)
+                    
+            for directory in created:
                 self.log(f"✓ Created directory: {directory}")
+            if len(created) < len(directories):
+                self.log(f"✓ {len(directories) - len(created)} directories already present")
             return True
         except Exception as e:
             self.log(f"✗ Failed to create directories: {e}", "ERROR")
@@ -441,7 +527,7 @@ pause
                 return False
                 
         # Install dependencies
-        if not self.install_python_dependencies():
+        if not self.install_python_dependencies(args.parallel_downloads):
             self.log("✗ Failed to install Python dependencies", "ERROR")
             return False
             
@@ -546,6 +632,14 @@ Examples:
         help="Run tests after setup"
     )
     
+    parser.add_argument(
+        "--parallel-downloads",
+        type=int,
+        default=5,
+        metavar="N",
+        help="Download Python packages with N parallel workers before installing (0 disables)"
+    )
+    
     parser.add_argument(
         "--platform",
         choices=["macos", "windows", "linux"],
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Cache Manager Test Suite
+Tests the L1 tier, batched lookups/stores across tiers and semantic key search
+"""
+
+import asyncio
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cache_manager import CacheManager, RedisCache, SemanticCacheLayer
+
+pytestmark = pytest.mark.unit
+
+
+class FakeRedisClient:
+    """In-process stand-in for a redis-py client"""
+    
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+    
+    def get(self, key):
+        return self.data.get(key)
+    
+    def set(self, key, value):
+        self.data[key] = value
+        self.ttls.pop(key, None)
+    
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+    
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+    
+    def delete(self, key):
+        return 1 if self.data.pop(key, None) is not None else 0
+    
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self)
+
+
+class FakeRedisPipeline:
+    """Queues commands and applies them to the fake client on execute()"""
+    
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+    
+    def set(self, key, value):
+        self.commands.append((self.client.set, (key, value)))
+    
+    def setex(self, key, ttl, value):
+        self.commands.append((self.client.setex, (key, ttl, value)))
+    
+    def execute(self):
+        results = [command(*args) for command, args in self.commands]
+        self.commands = []
+        return results
+
+
+class FakeEmbeddingModel:
+    """Embeds known texts to fixed vectors; unknown texts embed to zero"""
+    
+    def __init__(self, vectors):
+        self.vectors = vectors
+    
+    def encode(self, texts, batch_size=32):
+        return np.array([self.vectors.get(text, [0.0, 0.0, 0.0]) for text in texts], dtype=np.float32)
+
+
+def _fake_redis():
+    """A RedisCache backed by FakeRedisClient"""
+    redis_cache = RedisCache(prefix="test:")
+    redis_cache.client = FakeRedisClient()
+    redis_cache.connected = True
+    return redis_cache
+
+
+def _cache_manager(**caching):
+    """A memory-only cache manager; must be created inside a running event loop"""
+    return CacheManager({'caching': caching})
+
+
+async def test_l1_serves_recent_reads_until_expiry():
+    cache = _cache_manager(l1_ttl_seconds=0.05)
+    await cache.set("scene", {"objects": 3})
+    
+    assert await cache.get("scene") == {"objects": 3}
+    assert "default:scene" in cache._l1
+    
+    # Within the TTL the L1 answers even without the memory entry
+    cache.memory_cache.delete("default:scene")
+    assert await cache.get("scene") == {"objects": 3}
+    
+    await asyncio.sleep(0.1)
+    assert cache._l1_get("default:scene") is None
+    assert "default:scene" not in cache._l1
+    assert await cache.get("scene") is None
+
+
+async def test_l1_is_bounded():
+    cache = _cache_manager(l1_max_entries=2)
+    for key in ("a", "b", "c"):
+        cache._l1_put(key, key)
+    
+    assert list(cache._l1) == ["b", "c"]
+
+
+async def test_writes_invalidate_l1():
+    cache = _cache_manager()
+    await cache.set("material", "glass")
+    await cache.get("material")
+    
+    await cache.set("material", "steel")
+    assert await cache.get("material") == "steel"
+    
+    await cache.mset([("material", "wood", None)])
+    assert await cache.get("material") == "wood"
+    
+    await cache.delete("material")
+    assert await cache.get("material") is None
+
+
+async def test_clearing_invalidates_l1():
+    cache = _cache_manager()
+    await cache.set("preview", "low", namespace="renders", tags={"render"})
+    await cache.set("final", "high", namespace="scenes")
+    await cache.get("preview", namespace="renders")
+    await cache.get("final", namespace="scenes")
+    
+    await cache.clear_by_tags({"render"})
+    assert await cache.get("preview", namespace="renders") is None
+    
+    await cache.clear_namespace("scenes")
+    assert await cache.get("final", namespace="scenes") is None
+
+
+async def test_l1_hits_count_as_memory_accesses():
+    cache = _cache_manager()
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    
+    await cache.get("a")  # memory hit, fills the L1
+    await cache.get("a")  # L1 hit
+    await cache.mget(["a", "b"])  # L1 hit for "a", memory hit for "b"
+    
+    stats = cache.get_stats()
+    assert stats['l1_hits'] == 2
+    assert stats['memory_cache']['cache_hits'] == 4
+    assert stats['memory_cache']['hit_rate'] == 1.0
+    assert cache.cache_warmer.popular_items["default:a"]['access_count'] == 3
+    # The L1 hits keep "a" most recently used in the memory cache
+    await cache.get("a")
+    assert list(cache.memory_cache.cache)[-1] == "default:a"
+    assert cache.memory_cache.cache["default:a"].access_count == 4
+
+
+async def test_mset_mget_round_trip():
+    cache = _cache_manager()
+    stored = await cache.mset([("a", 1, None), ("b", [2, 3], 60)], namespace="steps")
+    
+    assert stored == [True, True]
+    assert await cache.mget(["a", "missing", "b"], namespace="steps") == [1, None, [2, 3]]
+    # Namespaces are kept apart
+    assert await cache.mget(["a", "b"]) == [None, None]
+
+
+async def test_mget_reads_through_from_redis():
+    redis_cache = _fake_redis()
+    writer = _cache_manager()
+    writer.redis_cache = redis_cache
+    await writer.mset([("a", {"status": "completed"}, None), ("b", 2, 30)], namespace="steps")
+    
+    # A second manager shares only the Redis tier
+    reader = _cache_manager()
+    reader.redis_cache = redis_cache
+    values = await reader.mget(["a", "b", "c"], namespace="steps")
+    
+    assert values == [{"status": "completed"}, 2, None]
+    assert reader.memory_cache.get("steps:a") == {"status": "completed"}
+    assert "steps:b" in reader._l1
+    assert "steps:c" not in reader._l1
+
+
+async def test_redis_mset_raw_and_mget():
+    redis_cache = _fake_redis()
+    cache = _cache_manager()
+    cache.redis_cache = redis_cache
+    await cache.mset([("x", "value", 120), ("y", "value", None)])
+    
+    client = redis_cache.client
+    assert client.ttls["test:default:x"] == 120
+    assert client.ttls["test:default:y"] == cache.default_ttl
+    assert await redis_cache.mget(["default:y", "default:z"]) == ["value", None]
+
+
+async def test_redis_disconnected_is_a_miss():
+    redis_cache = RedisCache()
+    redis_cache.connected = False
+    
+    assert await redis_cache.mget(["a", "b"]) == [None, None]
+    assert await redis_cache.mset_raw([("a", b"data", None)]) is False
+
+
+async def test_unpicklable_values_report_failed_redis_write(caplog):
+    redis_cache = _fake_redis()
+    cache = _cache_manager()
+    cache.redis_cache = redis_cache
+    unpicklable = lambda: None  # noqa: E731
+    
+    assert await cache.set("callback", unpicklable) is False
+    assert await cache.mset([("ok", 1, None), ("callback", unpicklable, None)]) == [True, False]
+    
+    assert "Cannot serialize" in caplog.text
+    # The memory tier still holds the value; Redis only the picklable one
+    assert cache.memory_cache.get("default:callback") is unpicklable
+    assert set(redis_cache.client.data) == {"test:default:ok"}
+
+
+def test_find_similar_keys_batch():
+    layer = SemanticCacheLayer(similarity_threshold=0.9)
+    layer.model = FakeEmbeddingModel({
+        "modern office": [1.0, 0.0, 0.0],
+        "office interior": [0.95, 0.1, 0.0],
+        "forest scene": [0.0, 1.0, 0.0],
+        "office query": [1.0, 0.05, 0.0],
+        "forest query": [0.0, 2.0, 0.0],
+    })
+    layer.index_key("office_a", "modern office")
+    layer.index_key("office_b", "office interior")
+    layer.index_key("forest", "forest scene")
+    
+    results = layer.find_similar_keys_batch(["office query", "forest query", "unknown"], max_results=2)
+    
+    assert set(results[0]) == {"office_a", "office_b"}
+    assert results[1] == ["forest"]
+    # A zero embedding matches nothing
+    assert results[2] == []
+    assert layer.find_similar_keys("forest query") == ["forest"]
+
+
+def test_find_similar_keys_batch_sees_index_changes():
+    layer = SemanticCacheLayer(similarity_threshold=0.9)
+    layer.model = FakeEmbeddingModel({"glass": [0.0, 0.0, 1.0], "glass query": [0.0, 0.1, 1.0]})
+    layer.index_key("glass_material", "glass")
+    assert layer.find_similar_keys_batch(["glass query"]) == [["glass_material"]]
+    
+    layer.remove_key("glass_material")
+    assert layer.find_similar_keys_batch(["glass query"]) == [[]]
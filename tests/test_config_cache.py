@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Config Cache Test Suite
+Tests YAML config loading through the JSON sidecar
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config_cache import load_yaml_config, sidecar_path
+
+pytestmark = pytest.mark.unit
+
+
+def test_sidecar_is_written_and_reused(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("caching:\n  enabled: true\n  ttl: 60\n")
+    
+    assert load_yaml_config(config_path) == {"caching": {"enabled": True, "ttl": 60}}
+    assert sidecar_path(config_path).exists()
+    
+    # A matching sidecar answers without parsing the YAML again
+    cached = json.loads(sidecar_path(config_path).read_text())
+    cached["config"]["caching"]["ttl"] = 120
+    sidecar_path(config_path).write_text(json.dumps(cached))
+    assert load_yaml_config(str(config_path)) == {"caching": {"enabled": True, "ttl": 120}}
+
+
+def test_edited_config_ignores_stale_sidecar(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("ttl: 60\n")
+    load_yaml_config(config_path)
+    
+    config_path.write_text("ttl: 3600\n")
+    
+    assert load_yaml_config(config_path) == {"ttl": 3600}
+
+
+def test_lossy_json_round_trip_is_not_cached(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("ports:\n  8080: http\n")
+    
+    assert load_yaml_config(config_path) == {"ports": {8080: "http"}}
+    assert not sidecar_path(config_path).exists()
+    assert load_yaml_config(config_path) == {"ports": {8080: "http"}}
+
+
+def test_corrupt_sidecar_falls_back_to_yaml(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("enabled: true\n")
+    sidecar_path(config_path).write_text("{not json")
+    
+    assert load_yaml_config(config_path) == {"enabled": True}
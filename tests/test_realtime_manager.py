@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Real-time Manager Test Suite
+Tests message encoding and decoding on both the orjson and stdlib json paths
+"""
+
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import realtime_manager
+from core.realtime_manager import ConnectedUser, MessageType, RealtimeManager, RealtimeMessage
+
+pytestmark = pytest.mark.unit
+
+
+class FakeWebSocket:
+    """Collects whatever the manager sends"""
+    
+    def __init__(self):
+        self.sent = []
+    
+    async def send(self, payload):
+        self.sent.append(payload)
+
+
+def _connect(manager, user_id):
+    """Register a connected user backed by a FakeWebSocket"""
+    websocket = FakeWebSocket()
+    manager.connected_users[f"conn_{user_id}"] = ConnectedUser(
+        user_id=user_id,
+        username=user_id,
+        connection_id=f"conn_{user_id}",
+        websocket=websocket,
+        connected_at=datetime.now(),
+        last_activity=datetime.now(),
+        permissions=set()
+    )
+    return websocket
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run the test with orjson (when installed) and with the stdlib fallback"""
+    if request.param and not realtime_manager.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(realtime_manager, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+def test_json_round_trip(json_backend):
+    payload = {"progress": 0.5, "steps": ["model", "light"], "meta": {"user": "u1"}}
+    
+    encoded = realtime_manager._json_dumps(payload)
+    
+    assert isinstance(encoded, str)
+    assert json.loads(encoded) == payload
+    assert realtime_manager._json_loads(encoded) == payload
+    assert realtime_manager._json_loads(encoded.encode()) == payload
+
+
+def test_json_loads_rejects_invalid_messages(json_backend):
+    # The message handler only catches json.JSONDecodeError
+    with pytest.raises(json.JSONDecodeError):
+        realtime_manager._json_loads("{not json")
+
+
+def test_orjson_accepts_non_string_keys():
+    if not realtime_manager.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    
+    assert json.loads(realtime_manager._json_dumps({1: "a"})) == {"1": "a"}
+
+
+def test_encode_message(json_backend):
+    message = RealtimeMessage(
+        message_id="m1",
+        type=MessageType.WORKFLOW_PROGRESS,
+        sender_id="system",
+        data={"workflow_id": "w1", "progress": 0.25},
+        timestamp=datetime(2024, 1, 1, 12, 0, 0)
+    )
+    
+    decoded = json.loads(RealtimeManager._encode_message(message))
+    
+    assert decoded == {
+        "message_id": "m1",
+        "type": "workflow_progress",
+        "sender_id": "system",
+        "data": {"workflow_id": "w1", "progress": 0.25},
+        "timestamp": "2024-01-01T12:00:00"
+    }
+
+
+async def test_encode_message_for_broadcast(json_backend):
+    manager = RealtimeManager({})
+    
+    decoded = json.loads(manager.encode_message(MessageType.SYSTEM_STATUS, {"cpu": 12.5}))
+    
+    assert decoded["type"] == "system_status"
+    assert decoded["sender_id"] == "system"
+    assert decoded["data"] == {"cpu": 12.5}
+    # Broadcasting with nobody connected is a no-op
+    await manager.broadcast_raw(manager.encode_message(MessageType.SYSTEM_STATUS, {}))
+
+
+async def test_broadcast_raw_sends_the_same_payload_to_everyone():
+    manager = RealtimeManager({})
+    sockets = [_connect(manager, "u1"), _connect(manager, "u2")]
+    payload = manager.encode_message(MessageType.SYSTEM_STATUS, {"cpu": 12.5})
+    
+    await manager.broadcast_raw(payload)
+    
+    assert [websocket.sent for websocket in sockets] == [[payload], [payload]]
+
+
+async def test_send_to_user_encodes_the_message():
+    manager = RealtimeManager({})
+    websocket = _connect(manager, "u1")
+    
+    await manager._send_to_user("conn_u1", RealtimeMessage(
+        message_id="m1",
+        type=MessageType.SYSTEM_STATUS,
+        sender_id="system",
+        data={"cpu": 1.0},
+        timestamp=datetime(2024, 1, 1)
+    ))
+    
+    assert json.loads(websocket.sent[0])["message_id"] == "m1"
+    assert "conn_u1" in manager.connected_users
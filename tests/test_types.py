@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Shared Types Test Suite
+Tests Severity coercion from the legacy string severities
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.types import SafetyViolation, Severity
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("legacy, expected", [
+    ("info", Severity.INFO),
+    ("warning", Severity.WARNING),
+    ("error", Severity.ERROR),
+    ("ERROR", Severity.ERROR),
+])
+def test_coerce_legacy_strings(legacy, expected):
+    assert Severity.coerce(legacy) is expected
+
+
+@pytest.mark.parametrize("value, expected", [
+    (Severity.WARNING, Severity.WARNING),
+    (0, Severity.INFO),
+    (2, Severity.ERROR),
+])
+def test_coerce_members_and_values(value, expected):
+    assert Severity.coerce(value) is expected
+
+
+@pytest.mark.parametrize("value, error", [
+    ("critical", KeyError),
+    (7, ValueError),
+])
+def test_coerce_rejects_unknown_severities(value, error):
+    with pytest.raises(error):
+        Severity.coerce(value)
+
+
+def test_severities_are_ordered():
+    assert max(Severity.coerce("info"), Severity.coerce("error"), Severity.coerce("warning")) is Severity.ERROR
+    assert Severity.coerce("warning") >= Severity.WARNING
+
+
+def test_violation_coerces_legacy_severity():
+    violation = SafetyViolation(rule_name="scale_limit", severity="error", message="Scale too large")
+    
+    assert violation.severity is Severity.ERROR